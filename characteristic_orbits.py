@@ -0,0 +1,159 @@
+"""
+Characteristic Orbit Radii of Kerr-Newman Throats
+=================================================
+
+Equatorial circular-orbit radii that serve as natural comparison scales
+for the throat size:
+
+- photon orbits     r^2 - 3Mr + 2Q^2 +/- 2a sqrt(Mr - Q^2) = 0
+- marginally bound  E(r) = 1 for a circular orbit
+- ISCO              Mr(6Mr - r^2 - 9Q^2 + 3a^2) + 4Q^2(Q^2 - a^2)
+                    -/+ 8a (Mr - Q^2)^(3/2) = 0
+
+(upper signs prograde). Each condition is solved for whole arrays of
+(M, a, Q) at once with the vectorised bracketed solver from
+kerr_newman_geometry; the photon orbit brackets the marginally bound
+orbit, which in turn lies inside the ISCO.
+"""
+
+import numpy as np
+
+from kerr_newman_geometry import (M_ELECTRON, M_MUON, M_TAU, KerrNewmanBatch,
+                                  solve_bracketed)
+
+# Structured record of all radii (m) for one configuration
+ORBIT_DTYPE = np.dtype([
+    ('photon_prograde', float), ('photon_retrograde', float),
+    ('mb_prograde', float), ('mb_retrograde', float),
+    ('isco_prograde', float), ('isco_retrograde', float),
+])
+
+
+def _photon_condition(r, a, Q, sign):
+    return r**2 - 3*r + 2*Q**2 + 2 * sign * a * np.sqrt(r - Q**2)
+
+
+def _isco_condition(r, a, Q, sign):
+    return (r * (6*r - r**2 - 9*Q**2 + 3*a**2) + 4*Q**2 * (Q**2 - a**2)
+            - 8 * sign * a * (r - Q**2)**1.5)
+
+
+def _marginally_bound_condition(r, a, Q, sign):
+    s = np.sqrt(r - Q**2)
+    D = r**2 - 3*r + 2*Q**2 + 2 * sign * a * s
+    return r**2 - 2*r + Q**2 + sign * a * s - r * np.sqrt(np.maximum(D, 0.0))
+
+
+def _solve(condition, lo, hi, a, Q, sign):
+    """Bracketed solve in units of M; NaN where [lo, hi] has no sign change"""
+    with np.errstate(invalid='ignore'):
+        f_lo = condition(lo, a, Q, sign)
+        f_hi = condition(hi, a, Q, sign)
+        bracketed = f_lo * f_hi <= 0
+        root, _ = solve_bracketed(lambda r: condition(r, a, Q, sign),
+                                  np.where(bracketed, lo, 1.0),
+                                  np.where(bracketed, hi, 2.0))
+    return np.where(bracketed, root, np.nan)
+
+
+def photon_orbit(a, Q, prograde=True, r_plus=None):
+    """Circular photon orbit radius in units of M (a, Q also in units of M)"""
+    sign = 1.0 if prograde else -1.0
+    a, Q = np.broadcast_arrays(np.asarray(a, dtype=float),
+                               np.asarray(Q, dtype=float))
+    if r_plus is None:
+        with np.errstate(invalid='ignore'):
+            r_plus = 1 + np.sqrt(1 - a**2 - Q**2)
+    return _solve(_photon_condition, np.broadcast_to(r_plus, a.shape),
+                  np.full(a.shape, 4.0), a, Q, sign)
+
+
+def marginally_bound_orbit(a, Q, prograde=True, r_photon=None, r_isco=None):
+    """Marginally bound (E = 1) circular orbit radius in units of M"""
+    sign = 1.0 if prograde else -1.0
+    a, Q = np.broadcast_arrays(np.asarray(a, dtype=float),
+                               np.asarray(Q, dtype=float))
+    if r_photon is None:
+        r_photon = photon_orbit(a, Q, prograde)
+    if r_isco is None:
+        r_isco = isco(a, Q, prograde, r_photon=r_photon)
+    # Nudge off the photon orbit, where E diverges
+    lo = r_photon * (1 + 1e-12)
+    return _solve(_marginally_bound_condition, lo, r_isco, a, Q, sign)
+
+
+def isco(a, Q, prograde=True, r_photon=None):
+    """Innermost stable circular orbit radius in units of M"""
+    sign = 1.0 if prograde else -1.0
+    a, Q = np.broadcast_arrays(np.asarray(a, dtype=float),
+                               np.asarray(Q, dtype=float))
+    if r_photon is None:
+        r_photon = photon_orbit(a, Q, prograde)
+    return _solve(_isco_condition, r_photon, np.full(a.shape, 10.0),
+                  a, Q, sign)
+
+
+def orbit_radii(batch):
+    """
+    All characteristic radii for every configuration of a KerrNewmanBatch.
+
+    Parameters:
+    -----------
+    batch : KerrNewmanBatch
+        Configurations; unphysical ones come out as NaN
+
+    Returns:
+    --------
+    radii : structured ndarray
+        ORBIT_DTYPE records in metres, shape batch.shape
+    """
+    M = batch.M
+    with np.errstate(invalid='ignore', divide='ignore'):
+        a, Q = np.abs(batch.a) / M, batch.Q / M
+        r_plus = batch.r_plus / M
+
+    radii = np.empty(batch.shape, dtype=ORBIT_DTYPE)
+    for prograde, suffix in ((True, 'prograde'), (False, 'retrograde')):
+        r_ph = photon_orbit(a, Q, prograde, r_plus=r_plus)
+        r_isco = isco(a, Q, prograde, r_photon=r_ph)
+        r_mb = marginally_bound_orbit(a, Q, prograde, r_photon=r_ph,
+                                      r_isco=r_isco)
+        radii['photon_' + suffix] = r_ph * M
+        radii['mb_' + suffix] = r_mb * M
+        radii['isco_' + suffix] = r_isco * M
+    return radii
+
+
+if __name__ == "__main__":
+    print("Characteristic orbit radii")
+    print("=" * 60)
+
+    # Analytic checks in units of M
+    print("\nSchwarzschild (expect 3, 4, 6):")
+    print(f"  photon {photon_orbit(0, 0)[()]:.6f}, "
+          f"mb {marginally_bound_orbit(0, 0)[()]:.6f}, "
+          f"isco {isco(0, 0)[()]:.6f}")
+    print("Extremal Kerr, retrograde (expect 4, 5.828427, 9):")
+    print(f"  photon {photon_orbit(1, 0, False)[()]:.6f}, "
+          f"mb {marginally_bound_orbit(1, 0, False)[()]:.6f}, "
+          f"isco {isco(1, 0, False)[()]:.6f}")
+
+    # Throat-scale comparison for the leptons (spin-0 proxies are physical)
+    masses = np.array([M_ELECTRON, M_MUON, M_TAU])
+    batch = KerrNewmanBatch(masses, spin=0.1, charge_e=0.5)
+    radii = orbit_radii(batch)
+    print("\nLepton-mass throats, spin 0.1, charge 0.5 (units of r+):")
+    for name, rec, r_plus in zip(('electron', 'muon', 'tau'), radii,
+                                 batch.r_plus):
+        print(f"  {name:8s}: photon {rec['photon_prograde']/r_plus:.3f}"
+              f"/{rec['photon_retrograde']/r_plus:.3f}, "
+              f"isco {rec['isco_prograde']/r_plus:.3f}"
+              f"/{rec['isco_retrograde']/r_plus:.3f}")
+
+    import time
+    grid = KerrNewmanBatch(np.logspace(-31, -26, 1000)[:, None],
+                           spin=np.linspace(0, 0.15, 100)[None, :],
+                           charge_e=0.3)
+    start = time.time()
+    radii = orbit_radii(grid)
+    print(f"\n{grid.size} configurations in {time.time() - start:.2f} s")
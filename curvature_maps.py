@@ -0,0 +1,211 @@
+"""
+Curvature and Field-Invariant Maps on (r, theta) Grids
+======================================================
+
+Closed-form Kerr-Newman quantities in Boyer-Lindquist coordinates, with
+
+    rho^2 = r^2 + a^2 cos^2 theta,    Delta = r^2 - 2Mr + a^2 + Q^2:
+
+- metric components g_tt, g_tphi, g_phiphi, g_rr, g_thth
+- electromagnetic invariants F_ab F^ab and F_ab *F^ab
+- Ricci scalar (zero for electrovacuum), R_ab R^ab = 4 Q^4 / rho^8
+- Kretschmann scalar R_abcd R^abcd and Weyl square C_abcd C^abcd
+
+The shared subexpressions (cos theta, r^2, a^2 cos^2 theta, rho^2, Delta)
+are computed once per block and reused by every field. Large maps are
+filled a block of theta-rows at a time, so only the outputs (optionally
+memory-mapped .npy files) scale with the full grid.
+"""
+
+import os
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from kerr_newman_geometry import M_ELECTRON, KerrNewmanBlackHole
+
+
+def _metric_g_tt(s):
+    return -(1 - (2 * s.M * s.r - s.Q2) / s.rho2)
+
+
+def _metric_g_tphi(s):
+    return -s.a * s.sin2 * (2 * s.M * s.r - s.Q2) / s.rho2
+
+
+def _metric_g_phiphi(s):
+    return s.sin2 * ((s.r2 + s.a2)**2 - s.a2 * s.delta * s.sin2) / s.rho2
+
+
+def _metric_g_rr(s):
+    return s.rho2 / s.delta
+
+
+def _metric_g_thth(s):
+    return s.rho2
+
+
+def _em_invariant(s):
+    # -2 Q^2 Re[(r - i a cos theta)^-4]
+    return -2 * s.Q2 * (s.r2**2 - 6 * s.r2 * s.a2c2 + s.a2c2**2) / s.rho8
+
+
+def _em_pseudoinvariant(s):
+    return 8 * s.Q2 * s.r * s.a * s.cos * (s.r2 - s.a2c2) / s.rho8
+
+
+def _ricci_scalar(s):
+    return np.zeros_like(s.rho2)
+
+
+def _ricci_squared(s):
+    return 4 * s.Q2**2 / s.rho8
+
+
+def _kretschmann(s):
+    M, Q2, r, r2, x = s.M, s.Q2, s.r, s.r2, s.a2c2
+    return 8 / (s.rho8 * s.rho2**2) * (
+        6 * M**2 * (r2**3 - 15 * r2**2 * x + 15 * r2 * x**2 - x**3)
+        - 12 * M * Q2 * r * (r2**2 - 10 * r2 * x + 5 * x**2)
+        + Q2**2 * (7 * r2**2 - 34 * r2 * x + 7 * x**2))
+
+
+def _weyl_squared(s):
+    # C^2 = K - 2 R_ab R^ab + R^2/3, with R = 0
+    return _kretschmann(s) - 8 * s.Q2**2 / s.rho8
+
+
+FIELDS = {
+    'g_tt': _metric_g_tt,
+    'g_tphi': _metric_g_tphi,
+    'g_phiphi': _metric_g_phiphi,
+    'g_rr': _metric_g_rr,
+    'g_thth': _metric_g_thth,
+    'em_invariant': _em_invariant,
+    'em_pseudoinvariant': _em_pseudoinvariant,
+    'ricci_scalar': _ricci_scalar,
+    'ricci_squared': _ricci_squared,
+    'kretschmann': _kretschmann,
+    'weyl_squared': _weyl_squared,
+}
+
+
+class _Subexpressions:
+    """Per-block common subexpressions shared by all field formulas"""
+
+    def __init__(self, M, a, Q, r, theta):
+        self.M, self.a, self.Q2, self.a2 = M, a, Q**2, a**2
+        self.r = r
+        self.cos = np.cos(theta)
+        self.sin2 = 1 - self.cos**2
+        self.r2 = r**2
+        self.a2c2 = self.a2 * self.cos**2
+        self.rho2 = self.r2 + self.a2c2
+        self.rho8 = self.rho2**4
+        self.delta = self.r2 - 2 * M * r + self.a2 + self.Q2
+
+
+class CurvatureMaps:
+    """
+    Closed-form field maps for one KerrNewmanBlackHole.
+
+    Radii are in metres and curvature scalars in SI (m^-4); the metric
+    components are those of the geometric-unit line element.
+    """
+
+    def __init__(self, black_hole):
+        self.bh = black_hole
+
+    def evaluate(self, r, theta, fields=None):
+        """
+        Evaluate fields at broadcast (r, theta) points in one pass.
+
+        Parameters:
+        -----------
+        r, theta : array_like
+            Boyer-Lindquist radius (m) and polar angle (rad)
+        fields : sequence of str or None
+            Names from FIELDS; default all
+
+        Returns:
+        --------
+        values : dict of ndarray
+        """
+        fields = FIELDS if fields is None else fields
+        r, theta = np.broadcast_arrays(np.asarray(r, dtype=float),
+                                       np.asarray(theta, dtype=float))
+        s = _Subexpressions(self.bh.M, self.bh.a, self.bh.Q, r, theta)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return {name: FIELDS[name](s) for name in fields}
+
+    def maps(self, r, theta, fields=None, block_rows=256, out_dir=None):
+        """
+        Fill full (theta, r) maps block by block.
+
+        Parameters:
+        -----------
+        r, theta : 1-D array_like
+            Radial and polar grids; the maps have shape (len(theta), len(r))
+        fields : sequence of str or None
+            Names from FIELDS; default all
+        block_rows : int
+            Theta rows evaluated together; bounds the temporary memory to
+            a few block_rows x len(r) arrays
+        out_dir : str or None
+            If given, each map is a memory-mapped <name>.npy in this
+            directory instead of an in-memory array
+
+        Returns:
+        --------
+        maps : dict of ndarray (or memmap)
+        """
+        fields = list(FIELDS) if fields is None else list(fields)
+        r = np.asarray(r, dtype=float)
+        theta = np.asarray(theta, dtype=float)
+        shape = (len(theta), len(r))
+
+        if out_dir is None:
+            maps = {name: np.empty(shape) for name in fields}
+        else:
+            os.makedirs(out_dir, exist_ok=True)
+            maps = {name: open_memmap(os.path.join(out_dir, name + '.npy'),
+                                      mode='w+', dtype=float, shape=shape)
+                    for name in fields}
+
+        for start in range(0, len(theta), block_rows):
+            rows = slice(start, start + block_rows)
+            block = self.evaluate(r[None, :], theta[rows, None], fields)
+            for name in fields:
+                maps[name][rows] = block[name]
+
+        if out_dir is not None:
+            for array in maps.values():
+                array.flush()
+        return maps
+
+
+if __name__ == "__main__":
+    import time
+
+    print("Kerr-Newman curvature maps")
+    print("=" * 60)
+
+    bh = KerrNewmanBlackHole(M_ELECTRON, spin=0.1, charge_e=0.5)
+    curvature = CurvatureMaps(bh)
+    print(f"M = {bh.M:.3e} m, a/M = {bh.a/bh.M:.3f}, Q/M = {bh.Q/bh.M:.3f}")
+
+    # Far from the hole K approaches the Schwarzschild value 48 M^2 / r^6
+    far = curvature.evaluate(1e3 * bh.M, np.pi/2, ['kretschmann'])
+    print(f"\nKretschmann at 1000 M: {far['kretschmann']:.3e} m^-4 "
+          f"(Schwarzschild estimate {48 * bh.M**2 / (1e3 * bh.M)**6:.3e})")
+
+    r = np.linspace(bh.r_plus, 20 * bh.M, 1024)
+    theta = np.linspace(1e-3, np.pi - 1e-3, 1024)
+    start = time.time()
+    maps = curvature.maps(r, theta, block_rows=128)
+    print(f"\n{len(maps)} maps of {len(theta)}x{len(r)} in "
+          f"{time.time() - start:.2f} s")
+
+    K = maps['kretschmann']
+    print(f"Kretschmann range on horizon-to-20M grid: "
+          f"{K.min():.3e} to {K.max():.3e} m^-4")
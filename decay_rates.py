@@ -71,18 +71,18 @@ class GeometricDecayModel:
         - Δn = 2: electric quadrupole (slower)
         - Δn >> 1: highly suppressed
         """
-        delta_n = abs(n2 - n1)
-        
-        # Selection rules from angular momentum conservation
-        # and parity considerations
-        if delta_n == 0:
-            return 0  # No transition
+        delta_n = np.abs(np.subtract(n2, n1))
         
         # Rough model: overlap decreases with mode number difference
         # Like Wigner 3j symbols for angular momentum
-        overlap = np.exp(-delta_n / 10) * np.sqrt(n1 * n2) / (n1 + n2)
+        # Keep n1 = n2 = 0 from dividing 0/0; the selection rule zeroes it
+        total = np.where(delta_n == 0, 1, np.add(n1, n2))
+        overlap = np.exp(-delta_n / 10) * np.sqrt(n1 * n2) / total
         
-        return overlap
+        # Selection rules from angular momentum conservation
+        # and parity considerations: no transition for delta_n = 0.
+        # np.where keeps this elementwise for array arguments.
+        return np.where(delta_n == 0, 0.0, overlap)[()]
     
     def geometric_transition_rate(self, m_initial, m_final, n_initial, n_final):
         """
@@ -98,9 +98,6 @@ class GeometricDecayModel:
         E_final = m_final * C**2
         delta_E = E_initial - E_final
         
-        if delta_E <= 0:
-            return 0  # Can't decay upward
-        
         # Mode overlap
         overlap = self.mode_overlap(n_final, n_initial)
         
@@ -108,7 +105,8 @@ class GeometricDecayModel:
         # This is a dimensional analysis guess based on QFT
         Gamma = (delta_E**3 / HBAR**4) * overlap**2 * (HBAR / C)
         
-        return Gamma
+        # Can't decay upward
+        return np.where(delta_E > 0, Gamma, 0.0)[()]
     
     def weak_decay_rate(self, m_initial, m_final, n_initial, n_final):
         """
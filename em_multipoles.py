@@ -0,0 +1,204 @@
+"""
+Electromagnetic Multipoles and Gyromagnetic Ratios
+==================================================
+
+The Kerr-Newman field has closed-form multipole moments (Hansen). With
+geometric M, a and Q, the mass/current and electric/magnetic moments of
+order l are
+
+    M_l + i S_l = M (i a)^l,      Q_l + i mu_l = Q (i a)^l,
+
+so the charge (l = 0) is accompanied by a magnetic dipole mu = Q a, an
+electric quadrupole -Q a^2, a magnetic octupole -Q a^3, and so on. The
+gyromagnetic ratio g = 2 mu M / (Q J) with J = M a is then identically 2
+for every Kerr-Newman configuration (Carter): the geometry has no
+anomalous moment, so measured anomalies (g - 2)/2 are entirely beyond it.
+g is nevertheless computed from the SI moments, and g - 2 is reported
+against a tolerance as a consistency check of the moment computation.
+
+SI moments use the same charge conversion as the classical geometry,
+Q_SI = Q c^2 / sqrt(k_e G), with mu_SI = Q_SI a c. Everything is
+elementwise on KerrNewmanBatch arrays, so millions of configurations are
+screened against measured magnetic moments in one pass.
+"""
+
+import numpy as np
+
+from kerr_newman_geometry import (C, CLASSICAL_CHARGE_SCALE, M_ELECTRON,
+                                  M_MUON, M_PROTON, M_TAU, KerrNewmanBatch)
+
+E_CHARGE = 1.602e-19  # Elementary charge (C)
+
+# Measured magnetic moments (J/T, sign dropped) and anomalies (g - 2)/2
+MEASURED_MOMENTS = {
+    'electron': {'mu': 9.2847647043e-24, 'anomaly': 1.15965218128e-3},
+    'muon': {'mu': 4.49044830e-26, 'anomaly': 1.16592059e-3},
+    'proton': {'mu': 1.41060679736e-26, 'anomaly': 1.792847344},
+}
+
+
+def multipole_moments(batch, l_max=4):
+    """
+    Geometric multipole moments up to order l_max.
+
+    Parameters:
+    -----------
+    batch : KerrNewmanBatch
+        Configurations
+    l_max : int
+        Highest multipole order
+
+    Returns:
+    --------
+    moments : dict of ndarray
+        'mass', 'current', 'electric', 'magnetic', each of shape
+        batch.shape + (l_max + 1,) and in metres^(l + 1)
+    """
+    l = np.arange(l_max + 1)
+    # (i a)^l without complex arithmetic: a^l times (1, 0, -1, 0) / (0, 1, 0, -1)
+    powers = batch.a[..., None]**l
+    real = powers * np.array([1, 0, -1, 0])[l % 4]
+    imag = powers * np.array([0, 1, 0, -1])[l % 4]
+    M, Q = batch.M[..., None], batch.Q[..., None]
+    return {'mass': M * real, 'current': M * imag,
+            'electric': Q * real, 'magnetic': Q * imag}
+
+
+def electromagnetic_moments_si(batch, l_max=4):
+    """
+    Electric (C m^l) and magnetic (A m^(l+1)) multipoles in SI units.
+
+    Returns:
+    --------
+    electric, magnetic : ndarray
+        Shape batch.shape + (l_max + 1,)
+    """
+    moments = multipole_moments(batch, l_max)
+    return (moments['electric'] / CLASSICAL_CHARGE_SCALE,
+            moments['magnetic'] * C / CLASSICAL_CHARGE_SCALE)
+
+
+def magnetic_dipole_moment(batch):
+    """Magnetic dipole moment Q_SI a c in A m^2 (= J/T)"""
+    return batch.Q * batch.a * C / CLASSICAL_CHARGE_SCALE
+
+
+def g_factor(batch):
+    """
+    Gyromagnetic ratio g = 2 m mu / (q J) from the SI moments.
+
+    q and mu come from electromagnetic_moments_si() and J = m a c, so g
+    reproduces the Kerr-Newman value 2 to rounding unless the moment
+    computation is inconsistent. NaN where the charge or the spin
+    vanishes and g is undefined.
+    """
+    electric, magnetic = electromagnetic_moments_si(batch, l_max=1)
+    q, mu = electric[..., 0], magnetic[..., 1]
+    J = batch.m_kg * batch.a * C
+    with np.errstate(divide='ignore', invalid='ignore'):
+        g = 2 * batch.m_kg * mu / (q * J)
+    return np.where((q != 0) & (J != 0), g, np.nan)
+
+
+def screen_magnetic_moments(batch, mu_measured, rtol=1e-3):
+    """
+    Compare predicted dipole moments with a measured one.
+
+    Parameters:
+    -----------
+    batch : KerrNewmanBatch
+        Candidate configurations
+    mu_measured : float or array_like
+        Measured |mu| in J/T, broadcast against the batch
+    rtol : float
+        Relative tolerance for a match
+
+    Returns:
+    --------
+    match : ndarray of bool
+        Configurations within rtol of the measurement
+    deviation : ndarray
+        Signed relative deviation (mu_pred - mu_measured) / mu_measured
+    """
+    deviation = np.abs(magnetic_dipole_moment(batch)) / mu_measured - 1
+    return np.abs(deviation) <= rtol, deviation
+
+
+def catalog_moments(catalog, quantum_corrected=True, atol=1e-12):
+    """
+    Dipole moment, g and g - 2 for a particle catalog.
+
+    Parameters:
+    -----------
+    catalog : dict
+        name -> {'mass_kg', 'spin', 'charge'}
+    quantum_corrected : bool
+        Parameter mode, as in KerrNewmanBlackHole
+    atol : float
+        Largest |g - 2| accepted as the Kerr-Newman value
+
+    Returns:
+    --------
+    moments : dict
+        name -> {'mu', 'g', 'g_minus_2', 'consistent'}; consistent is
+        False where |g - 2| exceeds atol or g is undefined
+    """
+    names = list(catalog)
+    batch = KerrNewmanBatch([catalog[n]['mass_kg'] for n in names],
+                            spin=[catalog[n]['spin'] for n in names],
+                            charge_e=[catalog[n]['charge'] for n in names],
+                            quantum_corrected=quantum_corrected)
+    mu = magnetic_dipole_moment(batch)
+    g = g_factor(batch)
+    return {name: {'mu': mu[i], 'g': g[i], 'g_minus_2': g[i] - 2,
+                   'consistent': bool(np.abs(g[i] - 2) <= atol)}
+            for i, name in enumerate(names)}
+
+
+if __name__ == "__main__":
+    import time
+
+    print("Electromagnetic multipoles and g-factors")
+    print("=" * 60)
+
+    # The classical geometry reads charge_e in coulombs, Q = q sqrt(k G)/c^2
+    catalog = {
+        'electron': {'mass_kg': M_ELECTRON, 'spin': 0.5, 'charge': -E_CHARGE},
+        'muon': {'mass_kg': M_MUON, 'spin': 0.5, 'charge': -E_CHARGE},
+        'tau': {'mass_kg': M_TAU, 'spin': 0.5, 'charge': -E_CHARGE},
+        'proton': {'mass_kg': M_PROTON, 'spin': 0.5, 'charge': E_CHARGE},
+    }
+    print("\nClassical parameters (mu_KN = q hbar / 2m):")
+    print("  particle   |mu| (J/T)   g         g - 2          measured |mu|  anomaly")
+    for name, m in catalog_moments(catalog, quantum_corrected=False).items():
+        measured = MEASURED_MOMENTS.get(name, {'mu': np.nan, 'anomaly': np.nan})
+        check = 'ok' if m['consistent'] else '!!'
+        print(f"  {name:9s} {abs(m['mu']):.4e}  {m['g']:.6f}  "
+              f"{m['g_minus_2']:+.1e} {check}  {measured['mu']:.4e}    "
+              f"{measured['anomaly']:.4e}")
+
+    # The Compton-scaled charge sqrt(alpha) hbar / (m c) exceeds the
+    # geometric value of e by M_Planck / m, and so does the moment
+    quantum = catalog_moments({'electron': {'mass_kg': M_ELECTRON,
+                                            'spin': 0.5, 'charge': -1}})
+    print(f"\nQuantum-corrected electron: |mu| = "
+          f"{abs(quantum['electron']['mu']):.3e} J/T, "
+          f"g = {quantum['electron']['g']:.6f}")
+
+    batch = KerrNewmanBatch(M_ELECTRON, spin=0.5, charge_e=-1)
+    moments = multipole_moments(batch, l_max=4)
+    print("\nElectron electric/magnetic multipoles (m^(l+1)):")
+    for l in range(5):
+        print(f"  l={l}: Q_l = {moments['electric'][l]:+.3e}, "
+              f"mu_l = {moments['magnetic'][l]:+.3e}")
+
+    # Screen a few million classical configurations against mu_e
+    sweep = KerrNewmanBatch(np.geomspace(1e-32, 1e-26, 2000)[:, None, None],
+                            spin=np.linspace(0.05, 2, 100)[None, :, None],
+                            charge_e=np.linspace(-2, 2, 21) * E_CHARGE,
+                            quantum_corrected=False)
+    start = time.time()
+    match, deviation = screen_magnetic_moments(
+        sweep, MEASURED_MOMENTS['electron']['mu'], rtol=1e-2)
+    print(f"\nScreened {sweep.size} configurations in "
+          f"{time.time() - start:.2f} s: {match.sum()} within 1% of mu_e")
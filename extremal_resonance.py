@@ -12,9 +12,15 @@ black holes - they're quantum geometric objects.
 The stability conditions for these throats determine allowed masses.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.optimize import minimize, fsolve
+from scipy.optimize import fsolve
+
+from kerr_newman_geometry import (log_mass_windows, ragged_arange,
+                                  solve_bracketed)
 
 # Physical constants
 C = 2.998e8
@@ -24,6 +30,25 @@ M_ELECTRON = 9.109e-31
 M_MUON = 1.883e-28
 M_TAU = 3.167e-27
 
+# One resonance found by scan_mass_spectrum
+SPECTRUM_DTYPE = np.dtype([('mass', float), ('n', int), ('S', float)])
+
+# Root status codes and records of find_resonant_mass
+CONVERGED = 0
+NO_BRACKET = 1
+NOT_CONVERGED = 2
+DEGENERATE = 3
+ROOT_DTYPE = np.dtype([('mass', float), ('n', int), ('spin', float),
+                       ('charge', float), ('residual', float), ('status', int)])
+
+# Spin and charge families of ExtremalGeometricResonance.family_cube
+SM_SPINS = (0.0, 0.5, 1.0, 1.5, 2.0)
+SM_CHARGES = (-1.0, -2/3, -1/3, 0.0, 1/3, 2/3, 1.0)
+
+# Mode-pair matches of MassRatioPredictor.ratio_matches
+MATCH_DTYPE = np.dtype([('n1', int), ('n2', int), ('scaling', int),
+                        ('ratio', float), ('error', float)])
+
 
 def compton_wavelength(m_kg):
     """Compton wavelength - the fundamental quantum scale for a particle"""
@@ -105,6 +130,16 @@ class ExtremalGeometricResonance:
         S : float
             Stability parameter. S ≈ 0 indicates a resonance.
         """
+        return abs(self.resonance_residual(mass_kg, mode_n))
+    
+    def resonance_residual(self, mass_kg, mode_n=1):
+        """
+        Signed mismatch (E_mode - E_rest) / E_rest for throat mode n.
+        
+        Its absolute value is the stability parameter; unlike S it changes
+        sign at a resonance, so resonances can be bracketed as roots.
+        Pure arithmetic, so spin, charge, mass and mode broadcast.
+        """
         circumference = self.throat_circumference(mass_kg)
         
         # Wavelength of mode n
@@ -116,61 +151,309 @@ class ExtremalGeometricResonance:
         # Rest energy of particle
         E_rest = mass_kg * C**2
         
-        # Stability: how well does geometric resonance match particle energy?
         # The throat is stable when its oscillation modes match the rest energy
-        S = abs(E_mode - E_rest) / E_rest
-        
-        return S
+        return (E_mode - E_rest) / E_rest
     
-    def find_resonant_mass(self, mode_n=1, initial_guess=M_ELECTRON):
+    def find_resonant_mass(self, mode_n=1, initial_guess=M_ELECTRON,
+                           mass_range=None, spin=None, charge_e=None,
+                           n_brackets=64, rtol=4*np.finfo(float).eps):
         """
-        Find the mass that creates a stable throat resonance for mode n.
+        Find the masses that create stable throat resonances.
+        
+        This solves E_mode(m) = m*c^2 as a signed root problem in log-mass
+        for every broadcast (mode, spin, charge) combination at once: the
+        residual is sampled on a coarse grid to bracket its first sign
+        change, which is then refined with a vectorised Illinois solver.
         
-        This solves: E_mode(m) = m*c^2
+        Note that with the Compton-scale throat_circumference the ratio
+        E_mode / E_rest does not depend on mass, so a root exists only
+        where n = spin_factor * charge_factor, and then at every mass;
+        such combinations (residual at rounding level across the whole
+        scan) are reported as DEGENERATE, with no mass since every mass
+        in range is a root.
+        
+        Parameters:
+        -----------
+        mode_n : int or array_like
+            Mode numbers
+        initial_guess : float
+            Centre of the default search range, initial_guess * 10^(+/-3)
+        mass_range : (float, float), optional
+            Search range in kg
+        spin, charge_e : float or array_like, optional
+            Override this model's spin and charge
+        n_brackets : int
+            Samples of the bracketing scan
+        rtol : float
+            Relative tolerance on log10(mass)
         
         Returns:
         --------
-        mass_kg : float
-            Resonant mass, or None if no solution found
+        roots : structured ndarray
+            ROOT_DTYPE records (mass, n, spin, charge, residual, status),
+            one per broadcast combination; mass is NaN unless status is
+            CONVERGED
         """
-        def residual(log_mass):
-            mass = 10**log_mass
-            return self.stability_parameter(mass, mode_n)
-        
-        try:
-            result = minimize(residual, np.log10(initial_guess), method='Nelder-Mead')
-            if result.fun < 0.01:  # 1% tolerance
-                return 10**result.x[0]
-            else:
-                return None
-        except:
-            return None
-    
-    def scan_mass_spectrum(self, n_modes=10, mass_range=(1e-32, 1e-25)):
+        spin = self.spin if spin is None else spin
+        charge_e = self.charge_e if charge_e is None else charge_e
+        if mass_range is None:
+            mass_range = (initial_guess * 1e-3, initial_guess * 1e3)
+        n, spin, charge_e = (x.ravel() for x in np.broadcast_arrays(
+            np.asarray(mode_n), np.asarray(spin, dtype=float),
+            np.asarray(charge_e, dtype=float)))
+        
+        log_m = np.linspace(np.log10(mass_range[0]), np.log10(mass_range[1]),
+                            n_brackets)
+        model = ExtremalGeometricResonance(spin=spin[:, None],
+                                           charge_e=charge_e[:, None])
+        residual = model.resonance_residual(10**log_m[None, :], n[:, None])
+        
+        roots = np.empty(len(n), dtype=ROOT_DTYPE)
+        roots['n'], roots['spin'], roots['charge'] = n, spin, charge_e
+        roots['mass'] = np.nan
+        roots['residual'] = np.nan
+        roots['status'] = NO_BRACKET
+        
+        # Residuals at rounding level everywhere: a mass-independent root
+        degenerate = np.all(np.abs(residual) <= 16 * np.finfo(float).eps, axis=1)
+        roots['residual'][degenerate] = 0.0
+        roots['status'][degenerate] = DEGENERATE
+        
+        change = residual[:, :-1] * residual[:, 1:] <= 0
+        rows = np.flatnonzero(change.any(axis=1) & ~degenerate)
+        if len(rows):
+            first = change[rows].argmax(axis=1)
+            active = ExtremalGeometricResonance(spin=spin[rows],
+                                                charge_e=charge_e[rows])
+            log_root, converged = solve_bracketed(
+                lambda x: active.resonance_residual(10**x, n[rows]),
+                log_m[first], log_m[first + 1], rtol=rtol)
+            mass = 10**log_root
+            roots['mass'][rows] = np.where(converged, mass, np.nan)
+            roots['residual'][rows] = active.resonance_residual(mass, n[rows])
+            roots['status'][rows] = np.where(converged, CONVERGED,
+                                             NOT_CONVERGED)
+        return roots
+    
+    def scan_mass_spectrum(self, n_modes=10, mass_range=(1e-32, 1e-25),
+                           n_masses=500, tolerance=0.05, max_cells=2**22):
         """
         Scan through mode numbers to find all stable throat configurations.
         
+        The stability parameter is evaluated as (modes x masses) blocks and
+        local minima along the mass axis are found with array comparisons.
+        Blocks overlap by one mass on each side, so minima at block edges
+        are not lost, and no block holds more than about max_cells values.
+        
+        Parameters:
+        -----------
+        n_modes : int
+            Modes n = 1..n_modes are scanned
+        mass_range : (float, float)
+            Log-spaced mass range in kg
+        n_masses : int
+            Number of masses
+        tolerance : float
+            Largest S accepted as a resonance
+        max_cells : int
+            Memory bound on the block size
+        
         Returns:
         --------
-        spectrum : list of (mass_kg, mode_n, stability)
+        spectrum : structured ndarray
+            SPECTRUM_DTYPE records (mass, n, S), sorted by mass
+        """
+        window = max(3, min(n_masses, max_cells))
+        found = list(self._spectrum_windows(n_modes, mass_range, n_masses,
+                                            None, tolerance, window,
+                                            max(1, max_cells // window)))
+        return np.concatenate(found) if found else np.empty(0, SPECTRUM_DTYPE)
+    
+    def iter_resonances(self, n_modes=10, mass_range=(1e-32, 1e-25),
+                        n_masses=500, per_decade=None, tolerance=0.05,
+                        window=1024, mode_block=256, max_hits=None):
         """
-        spectrum = []
-        
-        masses = np.logspace(np.log10(mass_range[0]), 
-                           np.log10(mass_range[1]), 
-                           500)
-        
-        for n in range(1, n_modes + 1):
-            # For each mode, find where stability is best
-            stabilities = [self.stability_parameter(m, n) for m in masses]
-            
-            # Find local minima (resonances)
-            for i in range(1, len(stabilities) - 1):
-                if stabilities[i] < stabilities[i-1] and stabilities[i] < stabilities[i+1]:
-                    if stabilities[i] < 0.05:  # 5% tolerance
-                        spectrum.append((masses[i], n, stabilities[i]))
-        
-        return sorted(spectrum, key=lambda x: x[0])
+        Stream the minima of scan_mass_spectrum() in order of increasing mass.
+        
+        The mass grid is walked in slices of `window` masses and the modes
+        in blocks of `mode_block`, so memory stays bounded whatever the
+        range or mode count, and the lowest resonances come out first.
+        
+        Parameters:
+        -----------
+        n_modes : int
+            Modes n = 1..n_modes are scanned
+        mass_range : (float, float)
+            Mass range in kg; the upper bound may be np.inf with per_decade
+        n_masses : int
+            Number of masses over the whole range (ignored with per_decade)
+        per_decade : float, optional
+            Masses per decade instead of n_masses
+        tolerance : float
+            Largest S accepted as a resonance
+        window, mode_block : int
+            Slice sizes along mass and mode
+        max_hits : int, optional
+            Stop after this many resonances
+        
+        Yields:
+        -------
+        resonance : SPECTRUM_DTYPE record (mass, n, S)
+        """
+        hits = 0
+        for block in self._spectrum_windows(n_modes, mass_range, n_masses,
+                                            per_decade, tolerance, window,
+                                            mode_block):
+            for resonance in block:
+                yield resonance
+                hits += 1
+                if max_hits is not None and hits >= max_hits:
+                    return
+    
+    def _spectrum_windows(self, n_modes, mass_range, n_masses, per_decade,
+                          tolerance, window, mode_block):
+        """Mass-sorted minima of each grid slice, one array per slice"""
+        # Slices share two masses, so each interior mass is tested once
+        for log_m in log_mass_windows(mass_range, n_masses, per_decade,
+                                      window, overlap=2):
+            masses = 10**log_m
+            found = []
+            for n_start in range(1, n_modes + 1, mode_block):
+                n = np.arange(n_start, min(n_start + mode_block, n_modes + 1))
+                S = self.stability_parameter(masses[None, :], n[:, None])
+                centre = S[:, 1:-1]
+                minimum = ((centre < S[:, :-2]) & (centre < S[:, 2:])
+                           & (centre < tolerance))
+                rows, cols = np.nonzero(minimum)
+                if not len(rows):
+                    continue
+                block = np.empty(len(rows), dtype=SPECTRUM_DTYPE)
+                block['mass'] = masses[1 + cols]
+                block['n'] = n[rows]
+                block['S'] = centre[rows, cols]
+                found.append(block)
+            if found:
+                yield np.sort(np.concatenate(found), order='mass', kind='stable')
+    
+    @classmethod
+    def family_cube(cls, n_modes=10, mass_range=(1e-32, 1e-25), n_masses=500,
+                    spins=SM_SPINS, charges=SM_CHARGES):
+        """
+        Evaluate every (spin, charge) family on one mass x mode grid.
+        
+        One instance with spin and charge arrays shaped for broadcasting
+        replaces a separate instance and scan per family.
+        
+        Parameters:
+        -----------
+        n_modes : int
+            Modes n = 1..n_modes
+        mass_range : (float, float)
+            Log-spaced mass range in kg
+        n_masses : int
+            Number of masses
+        spins, charges : sequence of float
+            Family axes, default all Standard Model spins and charges
+        
+        Returns:
+        --------
+        cube : FamilyCube
+            Quantities on (spin, charge, mass, n)
+        """
+        spins = np.asarray(spins, dtype=float)
+        charges = np.asarray(charges, dtype=float)
+        masses = np.logspace(np.log10(mass_range[0]), np.log10(mass_range[1]),
+                             n_masses)
+        modes = np.arange(1, n_modes + 1)
+        
+        model = cls(spin=spins[:, None, None, None],
+                    charge_e=charges[None, :, None, None])
+        mass = masses[None, None, :, None]
+        shape = (len(spins), len(charges), n_masses, n_modes)
+        # The throat does not depend on n; broadcast views cost no memory
+        data = {
+            'throat_circumference': np.broadcast_to(
+                model.throat_circumference(mass), shape),
+            'throat_energy_density': np.broadcast_to(
+                model.throat_energy_density(mass), shape),
+            'stability_parameter': model.stability_parameter(mass, modes),
+        }
+        return FamilyCube(spins, charges, masses, modes, data)
+
+
+class FamilyCube:
+    """
+    Labelled (spin, charge, mass, n) arrays of the extremal model.
+    
+    cube['stability_parameter'] is the 4D array, cube.coords its axis
+    values in the order of cube.dims, and cube.sel() picks one family.
+    """
+    
+    dims = ('spin', 'charge', 'mass', 'n')
+    
+    def __init__(self, spins, charges, masses, modes, data):
+        self.coords = {'spin': spins, 'charge': charges, 'mass': masses,
+                       'n': modes}
+        self.data = data
+    
+    def __getitem__(self, quantity):
+        return self.data[quantity]
+    
+    @property
+    def shape(self):
+        return tuple(len(self.coords[d]) for d in self.dims)
+    
+    @property
+    def families(self):
+        """All (spin, charge) pairs, spin-major"""
+        return [(float(s), float(q)) for s in self.coords['spin']
+                for q in self.coords['charge']]
+    
+    def _index(self, spin, charge):
+        i = np.flatnonzero(np.isclose(self.coords['spin'], spin))
+        j = np.flatnonzero(np.isclose(self.coords['charge'], charge))
+        if not len(i) or not len(j):
+            raise KeyError(f"no family with spin {spin}, charge {charge}")
+        return i[0], j[0]
+    
+    def sel(self, spin, charge):
+        """(mass, n) arrays of every quantity for one family"""
+        i, j = self._index(spin, charge)
+        return {name: values[i, j] for name, values in self.data.items()}
+    
+    def resonances(self, tolerance=0.05):
+        """
+        Local minima of S along the mass axis, per family.
+        
+        Same criterion as scan_mass_spectrum(), applied to the whole cube
+        at once.
+        
+        Returns:
+        --------
+        spectra : dict
+            (spin, charge) -> SPECTRUM_DTYPE records (mass, n, S) sorted
+            by mass, for every family
+        """
+        S = self.data['stability_parameter']
+        centre = S[:, :, 1:-1]
+        minimum = ((centre < S[:, :, :-2]) & (centre < S[:, :, 2:])
+                   & (centre < tolerance))
+        # Mass-major order within each family, so a stable sort by mass
+        # lists equal masses by mode, as scan_mass_spectrum does
+        i, j, k, l = np.nonzero(minimum)
+        
+        spectra = {}
+        n_charges = len(self.coords['charge'])
+        family = i * n_charges + j
+        for f, (spin, charge) in enumerate(self.families):
+            rows = family == f
+            spectrum = np.empty(rows.sum(), dtype=SPECTRUM_DTYPE)
+            spectrum['mass'] = self.coords['mass'][1 + k[rows]]
+            spectrum['n'] = self.coords['n'][l[rows]]
+            spectrum['S'] = centre[i[rows], j[rows], k[rows], l[rows]]
+            spectra[(spin, charge)] = np.sort(spectrum, order='mass',
+                                              kind='stable')
+        return spectra
 
 
 class MassRatioPredictor:
@@ -208,51 +491,272 @@ class MassRatioPredictor:
         
         return ratios
     
-    def compare_to_leptons(self):
+    def scaling_exponents(self, spin=0.5):
+        """Exponents alpha of the geometric_ratio() scalings, by name"""
+        return {'linear': 1.0, 'quadratic': 2.0, 'geometric_mean': 1.5,
+                'spin_modified': 1.0 + spin}
+    
+    def ratio_matches(self, targets, exponents=None, n_max=10**5,
+                      tolerance=0.1, best=10, primitive=True, chunk=8192):
+        """
+        Best mode pairs (n1 < n2 <= n_max) with (n2/n1)^alpha near each target.
+        
+        For fixed n1 the candidate log-ratios log n2 - log n1 are already
+        in ascending order, so the table log(1..n_max) is built once and
+        binary-searched for the tolerance window and for the centre
+        n1 * target^(1/alpha) of every n1 in a chunk at once. Only the
+        `best` nearest n2 on each side of the centre can be among the
+        overall best, so ~n_max^2 / 2 pairs per exponent cost
+        O(n_max * best) work and memory bounded by chunk * best.
+        Repeated exponents are searched once.
+        
+        Parameters:
+        -----------
+        targets : dict
+            name -> target mass ratio
+        exponents : dict or sequence of float, optional
+            Scaling exponents alpha (nonzero); default scaling_exponents()
+        n_max : int
+            Largest mode number
+        tolerance : float
+            Largest relative error |ratio - target| / target accepted
+        best : int
+            Matches kept per target
+        primitive : bool
+            Drop pairs with a common factor (same ratio as the reduced
+            pair)
+        chunk : int
+            Values of n1 handled per vectorised step
+        
+        Returns:
+        --------
+        matches : dict
+            name -> MATCH_DTYPE records (n1, n2, scaling, ratio, error)
+            sorted by error; scaling indexes the first occurrence of the
+            exponent in the exponent list
+        """
+        if exponents is None:
+            exponents = self.scaling_exponents()
+        if isinstance(exponents, dict):
+            exponents = exponents.values()
+        exponents = list(exponents)
+        log_n = np.log(np.arange(1, n_max + 1))
+        offsets = np.arange(-best, best)
+        
+        matches = {}
+        for name, target in targets.items():
+            kept = np.empty(0, dtype=MATCH_DTYPE)
+            for scaling, alpha in enumerate(exponents):
+                if alpha in exponents[:scaling]:
+                    continue
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    bounds = np.log(target * np.array([1 - tolerance,
+                                                       1 + tolerance])) / alpha
+                # A tolerance of 1 or more leaves the near side unbounded
+                low, high = np.sort(np.nan_to_num(bounds, nan=-np.inf))
+                shift = np.log(target) / alpha
+                
+                for n1_start in range(1, n_max, chunk):
+                    n1 = np.arange(n1_start, min(n1_start + chunk, n_max))
+                    log_n1 = log_n[n1 - 1]
+                    # Indices into log_n, i.e. n2 - 1; n2 > n1 means index >= n1
+                    lo = np.maximum(np.searchsorted(log_n, log_n1 + low), n1)
+                    hi = np.searchsorted(log_n, log_n1 + high, side='right')
+                    # The ideal n2 may lie below n1 + 1 (targets under 1)
+                    # or past n_max; the nearest allowed ones are at the edge
+                    centre = np.clip(np.searchsorted(log_n, log_n1 + shift),
+                                     lo, hi)
+                    index = centre[:, None] + offsets
+                    valid = (index >= lo[:, None]) & (index < hi[:, None])
+                    rows, cols = np.nonzero(valid)
+                    if not len(rows):
+                        continue
+                    n2 = index[rows, cols] + 1
+                    ratio = (n2 / n1[rows])**alpha
+                    error = np.abs(ratio - target) / target
+                    ok = error < tolerance
+                    if primitive:
+                        ok &= np.gcd(n1[rows], n2) == 1
+                    
+                    block = np.empty(ok.sum(), dtype=MATCH_DTYPE)
+                    block['n1'] = n1[rows][ok]
+                    block['n2'] = n2[ok]
+                    block['scaling'] = scaling
+                    block['ratio'] = ratio[ok]
+                    block['error'] = error[ok]
+                    kept = np.concatenate([kept, block])
+                    if len(kept) > best:
+                        kept = kept[np.argpartition(kept['error'], best)[:best]]
+            matches[name] = np.sort(kept, order=['error', 'n1', 'n2'])
+        return matches
+    
+    def compare_to_leptons(self, n_max=10**5, spin=0.5, tolerance=0.1, best=10):
         """
         Compare geometric predictions to known lepton masses.
+        
+        Parameters:
+        -----------
+        n_max : int
+            Largest mode number searched
+        spin : float
+            Spin of the spin_modified scaling
+        tolerance : float
+            Largest relative error reported
+        best : int
+            Matches shown per ratio
         """
         print("\n" + "="*70)
         print("GEOMETRIC MASS RATIO PREDICTIONS vs KNOWN LEPTONS")
         print("="*70)
         
         # Known ratios
-        r_mu_e = M_MUON / M_ELECTRON  # ≈ 206.77
-        r_tau_mu = M_TAU / M_MUON      # ≈ 16.82
-        r_tau_e = M_TAU / M_ELECTRON   # ≈ 3477
+        targets = {
+            'μ/e': M_MUON / M_ELECTRON,  # ≈ 206.77
+            'τ/μ': M_TAU / M_MUON,       # ≈ 16.82
+            'τ/e': M_TAU / M_ELECTRON,   # ≈ 3477
+        }
         
         print(f"\nKnown mass ratios:")
-        print(f"  μ/e  = {r_mu_e:.2f}")
-        print(f"  τ/μ  = {r_tau_mu:.2f}")
-        print(f"  τ/e  = {r_tau_e:.2f}")
+        for pair, ratio in targets.items():
+            print(f"  {pair}  = {ratio:.2f}")
         
         # Test if any mode combinations match
-        print(f"\nSearching for mode combinations that match...")
+        print(f"\nSearching mode pairs up to n={n_max} that match...")
+        
+        scalings = self.scaling_exponents(spin)
+        # Scalings that coincide at this spin share one label
+        names = ['/'.join(other for other, beta in scalings.items()
+                          if beta == alpha) for alpha in scalings.values()]
+        matches = self.ratio_matches(targets, scalings, n_max=n_max,
+                                     tolerance=tolerance, best=best)
+        
+        for pair, found in matches.items():
+            if not len(found):
+                print(f"\n{pair}: no mode pair within {tolerance*100:.0f}%.")
+                continue
+            print(f"\n{pair}: best {len(found)} matches")
+            for n1, n2, scaling, ratio, error in found:
+                print(f"  n={n1}→{n2}, {names[scaling] + ',':29s} "
+                      f"ratio={ratio:10.4f}, error={error*100:.2e}%")
+    
+    def fit_mode_ladder(self, masses, n_max=10**4, tolerance=1e-3,
+                        alpha_range=(0.25, 4.0), best=20, primitive=True,
+                        chunk=None, processes=None):
+        """
+        Integer modes n_1 < ... < n_k and one exponent alpha with
+        (n_j / n_1)^alpha = m_j / m_1 for every particle at once.
         
-        best_matches = []
+        Branch and bound on the modes in order. Each partial assignment
+        carries the interval of alpha still compatible with all ratios
+        fixed so far, which bounds the next mode to an integer interval;
+        assignments whose alpha interval empties are pruned. The frontier
+        is expanded level by level as arrays, and the n_1 subtrees are
+        split into chunks solved in parallel.
         
-        for n1 in range(1, 20):
-            for n2 in range(n1+1, 30):
-                ratios = self.geometric_ratio(n1, n2)
-                
-                for name, ratio in ratios.items():
-                    # Check muon/electron
-                    error_mu = abs(ratio - r_mu_e) / r_mu_e
-                    if error_mu < 0.1:  # Within 10%
-                        best_matches.append(('μ/e', n1, n2, name, ratio, error_mu))
-                    
-                    # Check tau/muon
-                    error_tau_mu = abs(ratio - r_tau_mu) / r_tau_mu
-                    if error_tau_mu < 0.1:
-                        best_matches.append(('τ/μ', n1, n2, name, ratio, error_tau_mu))
-        
-        if best_matches:
-            print(f"\nFound {len(best_matches)} potential matches:")
-            for pair, n1, n2, scaling, ratio, error in sorted(best_matches, key=lambda x: x[5])[:10]:
-                print(f"  {pair}: n={n1}→{n2}, {scaling:15s}, ratio={ratio:6.1f}, error={error*100:.1f}%")
+        Parameters:
+        -----------
+        masses : sequence of float
+            k >= 2 particle masses (e.g. the three leptons), any order
+        n_max : int
+            Largest mode number
+        tolerance : float
+            Largest relative error of every ratio m_j / m_1
+        alpha_range : (float, float)
+            Positive exponent bounds
+        best : int
+            Number of fits returned
+        primitive : bool
+            Drop mode tuples with a common factor (same ratios as the
+            reduced tuple)
+        chunk : int, optional
+            n_1 values per subtree task; default keeps ~1e6 frontier rows
+        processes : int or None
+            Worker processes, default os.cpu_count(); 1 runs in-process
+        
+        Returns:
+        --------
+        fits : structured ndarray
+            Records (n, alpha, error) sorted by error, n in order of
+            increasing mass and error the largest relative ratio error
+            at the least-squares (in log) alpha
+        """
+        log_ratio = np.log(np.sort(np.asarray(masses, dtype=float)))
+        log_ratio = log_ratio[1:] - log_ratio[0]
+        settings = (log_ratio, n_max, tolerance, tuple(alpha_range), best,
+                    primitive)
+        
+        # n_1 is at most n_max shrunk by the smallest ratio at alpha_hi
+        n1_max = int(n_max * np.exp(-np.log1p(-tolerance) / alpha_range[1]
+                                    - log_ratio[0] / alpha_range[1]))
+        n1_max = min(n1_max, n_max - len(log_ratio))
+        chunk = chunk or max(1, 2**20 // n_max)
+        jobs = [(settings, start, min(start + chunk, n1_max + 1))
+                for start in range(1, n1_max + 1, chunk)]
+        
+        processes = processes or os.cpu_count()
+        if processes == 1:
+            results = list(map(_ladder_subtree, jobs))
         else:
-            print("\nNo close matches found with simple mode ratios.")
-            print("More complex geometric factors may be needed.")
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                results = list(pool.map(_ladder_subtree, jobs))
+        
+        fits = np.concatenate([np.empty(0, _ladder_dtype(len(log_ratio) + 1))]
+                              + results)
+        return np.sort(fits, order='error', kind='stable')[:best]
+
+
+def _ladder_dtype(k):
+    return np.dtype([('n', int, (k,)), ('alpha', float), ('error', float)])
+
+
+def _ladder_subtree(job):
+    """Best mode-ladder fits for n_1 in [n1_start, n1_stop)"""
+    (log_ratio, n_max, tolerance, alpha_range, best, primitive), \
+        n1_start, n1_stop = job
+    lower = log_ratio + np.log1p(-tolerance)
+    upper = log_ratio + np.log1p(tolerance)
+    
+    modes = np.arange(n1_start, n1_stop)[:, None]
+    alpha_lo = np.full(len(modes), float(alpha_range[0]))
+    alpha_hi = np.full(len(modes), float(alpha_range[1]))
+    for j in range(len(log_ratio)):
+        # alpha log(n_j / n_1) must reach [lower_j, upper_j] for some
+        # alpha in the current interval; the slack only costs work, the
+        # exact alpha update below decides
+        n1 = modes[:, 0]
+        lo = np.ceil(n1 * np.exp(lower[j] / alpha_hi) * (1 - 1e-12))
+        hi = np.floor(n1 * np.exp(upper[j] / alpha_lo) * (1 + 1e-12))
+        lo = np.maximum(lo, modes[:, -1] + 1).astype(int)
+        hi = np.minimum(hi, n_max).astype(int)
+        n_j, owner = ragged_arange(lo, hi + 1)
+        
+        log_n = np.log(n_j / n1[owner])
+        alpha_lo = np.maximum(alpha_lo[owner], lower[j] / log_n)
+        alpha_hi = np.minimum(alpha_hi[owner], upper[j] / log_n)
+        keep = alpha_lo <= alpha_hi
+        modes = np.column_stack([modes[owner], n_j])[keep]
+        alpha_lo, alpha_hi = alpha_lo[keep], alpha_hi[keep]
+    
+    if primitive:
+        reduced = np.gcd.reduce(modes, axis=1) == 1
+        modes, alpha_lo, alpha_hi = (modes[reduced], alpha_lo[reduced],
+                                     alpha_hi[reduced])
+    
+    # Least squares in log, kept inside the feasible interval
+    log_n = np.log(modes[:, 1:] / modes[:, :1])
+    alpha = np.clip(log_n @ log_ratio / np.sum(log_n**2, axis=1),
+                    alpha_lo, alpha_hi)
+    error = np.max(np.abs(np.expm1(alpha[:, None] * log_n - log_ratio)),
+                   axis=1)
+    
+    if len(error) > best:
+        top = np.argpartition(error, best)[:best]
+        modes, alpha, error = modes[top], alpha[top], error[top]
+    fits = np.empty(len(error), dtype=_ladder_dtype(modes.shape[1]))
+    fits['n'] = modes
+    fits['alpha'] = alpha
+    fits['error'] = error
+    return fits
 
 
 def visualize_stability_landscape():
@@ -318,7 +822,7 @@ if __name__ == "__main__":
     print("-" * 70)
     spectrum = model.scan_mass_spectrum(n_modes=15)
     
-    if spectrum:
+    if len(spectrum):
         print(f"\nFound {len(spectrum)} stable configurations:")
         for i, (mass, n, stability) in enumerate(spectrum[:20]):
             ratio_to_electron = mass / M_ELECTRON
@@ -327,12 +831,33 @@ if __name__ == "__main__":
     else:
         print("\nNo resonances found. Model needs refinement.")
     
+    # Every spin/charge family in one broadcast
+    cube = ExtremalGeometricResonance.family_cube(n_modes=15)
+    spectra = cube.resonances()
+    print(f"\nFamily cube {dict(zip(cube.dims, cube.shape))}:")
+    # S is flat in mass here, so a family with S < tolerance shows
+    # rounding-level minima all along the axis; summarise by mode
+    for (spin, charge), found in spectra.items():
+        if len(found):
+            print(f"  spin {spin}, charge {charge:+.2f}: modes "
+                  f"{np.unique(found['n']).tolist()}, "
+                  f"min S = {found['S'].min():.4f}")
+    print(f"  {sum(len(f) > 0 for f in spectra.values())} of "
+          f"{len(cube.families)} families have resonances")
+    
     # Test mass ratio predictions
     print("\n\n3. MASS RATIO PREDICTIONS")
     print("-" * 70)
     predictor = MassRatioPredictor()
     predictor.compare_to_leptons()
     
+    # One exponent for all three leptons at once
+    fits = predictor.fit_mode_ladder([M_ELECTRON, M_MUON, M_TAU], n_max=10**4,
+                                     tolerance=1e-4, best=5)
+    print("\nSimultaneous fits (n_e, n_μ, n_τ) with a common exponent α:")
+    for n, alpha, error in fits:
+        print(f"  n={tuple(n.tolist())}, α={alpha:.6f}, max error={error*100:.2e}%")
+    
     # Visualize
     print("\n\n4. VISUALIZATION")
     print("-" * 70)
@@ -9,6 +9,8 @@ to geometric stability resonances in wormhole throat configurations.
 Physical Constants (SI units)
 """
 
+from functools import cached_property
+
 import numpy as np
 from scipy.optimize import fsolve, minimize
 from scipy.integrate import odeint
@@ -30,6 +32,14 @@ M_MUON = 1.883e-28
 M_TAU = 3.167e-27
 M_PROTON = 1.673e-27
 
+# Precomputed factors for the charge parameter; Q = charge * scale (m/C)
+# in the classical geometry
+_SQRT_ALPHA = np.sqrt(ALPHA)
+CLASSICAL_CHARGE_SCALE = np.sqrt(K_E * G) / C**2
+
+# Record layout returned by resonance searches
+RESONANCE_DTYPE = np.dtype([('mass', float), ('n', int), ('delta', float)])
+
 # Derived units for micro-black-holes
 def geometric_mass(m_kg):
     """Convert mass in kg to geometric units (length)"""
@@ -44,6 +54,74 @@ def schwarzschild_radius(m_kg):
     return 2 * G * m_kg / C**2
 
 
+def kerr_newman_parameters(mass_kg, spin, charge_e, quantum_corrected=True):
+    """
+    Geometric parameters (M, a, Q) in metres.
+
+    Pure arithmetic, so it works elementwise on scalars and NumPy arrays
+    alike. Shared by KerrNewmanBlackHole, KerrNewmanBatch and the
+    analysis modules that need (M, a, Q) without building a batch.
+    """
+    if quantum_corrected:
+        # For quantum particles, use Compton wavelength as effective "size"
+        # This represents quantum smearing of the would-be singularity
+        lambda_c = compton_wavelength(mass_kg)
+        # Effective geometric mass scaled by quantum effects
+        M = lambda_c / (2 * np.pi)  # Use Compton as fundamental scale
+        a = spin * HBAR / (mass_kg * C)  # Angular momentum
+        # Scale charge to match quantum regime
+        Q = charge_e * HBAR / (mass_kg * C) * _SQRT_ALPHA
+    else:
+        # Classical Kerr-Newman
+        M = geometric_mass(mass_kg)
+        a = spin * HBAR / (mass_kg * C)
+        Q = charge_e * CLASSICAL_CHARGE_SCALE
+    return M, a, Q
+
+
+def is_physical_configuration(mass_kg, spin=0.5, charge_e=1.0,
+                              quantum_corrected=True):
+    """
+    Horizon check M^2 >= a^2 + Q^2 straight from particle parameters.
+    
+    Needs no KerrNewmanBlackHole instance and no square roots, and works
+    elementwise on arrays. In the quantum-corrected regime M, a and Q all
+    scale as 1/m, so the answer is independent of mass.
+    """
+    M, a, Q = kerr_newman_parameters(mass_kg, spin, charge_e,
+                                      quantum_corrected)
+    return M**2 >= a**2 + Q**2
+
+
+def _horizon_discriminant(M, a, Q):
+    # M^2 - a^2 - Q^2 as (M - s)(M + s), s = hypot(a, Q): no squares of
+    # tiny geometric lengths, and near extremality the only rounding in
+    # the small factor is that of s
+    s = np.hypot(a, Q)
+    return (M - s) * (M + s)
+
+
+def _outer_horizon(M, a, Q):
+    return M + np.sqrt(_horizon_discriminant(M, a, Q))
+
+
+def _inner_horizon(M, a, Q):
+    # Vieta, r+ r- = a^2 + Q^2, instead of M - sqrt(...), which cancels
+    # catastrophically for small a and Q
+    return (a**2 + Q**2) / _outer_horizon(M, a, Q)
+
+
+def _ergosphere_radius(M, a, Q, theta):
+    return M + np.sqrt(M**2 - a**2 * np.cos(theta)**2 - Q**2)
+
+
+def _effective_potential(M, Q, r, l):
+    # Centrifugal barrier + geometry
+    return (l * (l + 1) / r**2 +
+            (2*M - r) / r**3 +
+            Q**2 / r**4)
+
+
 class KerrNewmanBlackHole:
     """
     Kerr-Newman black hole with mass M, angular momentum J, and charge Q.
@@ -51,8 +129,16 @@ class KerrNewmanBlackHole:
     The Kerr-Newman metric describes a rotating, charged black hole.
     For micro-black-holes, we hypothesize these parameters correspond to
     particle properties: mass, spin, and charge.
+
+    This is the single-configuration view; the formulas live in module
+    level kernels shared with KerrNewmanBatch, which evaluates whole
+    parameter grids at once. Instances are slotted and the key radii are
+    computed on first access, so building millions of them is cheap.
     """
     
+    __slots__ = ('m_kg', 'spin', 'charge_e', 'quantum_corrected',
+                 'M', 'a', 'Q', '_r_plus', '_r_minus', '_r_ergosphere')
+    
     def __init__(self, mass_kg, spin=0.5, charge_e=1.0, quantum_corrected=True):
         """
         Initialize Kerr-Newman black hole
@@ -73,37 +159,43 @@ class KerrNewmanBlackHole:
         self.charge_e = charge_e
         self.quantum_corrected = quantum_corrected
         
-        # For quantum particles, use Compton wavelength as effective "size"
-        # This represents quantum smearing of the would-be singularity
-        if quantum_corrected:
-            lambda_c = compton_wavelength(mass_kg)
-            # Effective geometric mass scaled by quantum effects
-            self.M = lambda_c / (2 * np.pi)  # Use Compton as fundamental scale
-            self.a = spin * HBAR / (mass_kg * C)  # Angular momentum
-            # Scale charge to match quantum regime
-            self.Q = charge_e * HBAR / (mass_kg * C) * np.sqrt(ALPHA)
-        else:
-            # Classical Kerr-Newman
-            self.M = geometric_mass(mass_kg)
-            self.a = spin * HBAR / (mass_kg * C)
-            self.Q = charge_e * np.sqrt(K_E * G) / C**2
+        self.M, self.a, self.Q = kerr_newman_parameters(
+            mass_kg, spin, charge_e, quantum_corrected)
         
-        # Key radii
-        self.r_plus = self.outer_horizon()
-        self.r_minus = self.inner_horizon()
-        self.r_ergosphere = self.ergosphere_radius()
+        # Key radii, filled in lazily
+        self._r_plus = None
+        self._r_minus = None
+        self._r_ergosphere = None
+    
+    @property
+    def r_plus(self):
+        if self._r_plus is None:
+            self._r_plus = self.outer_horizon()
+        return self._r_plus
+    
+    @property
+    def r_minus(self):
+        if self._r_minus is None:
+            self._r_minus = self.inner_horizon()
+        return self._r_minus
+    
+    @property
+    def r_ergosphere(self):
+        if self._r_ergosphere is None:
+            self._r_ergosphere = self.ergosphere_radius()
+        return self._r_ergosphere
         
     def outer_horizon(self):
         """Outer event horizon radius"""
-        return self.M + np.sqrt(self.M**2 - self.a**2 - self.Q**2)
+        return _outer_horizon(self.M, self.a, self.Q)
     
     def inner_horizon(self):
         """Inner (Cauchy) horizon radius"""
-        return self.M - np.sqrt(self.M**2 - self.a**2 - self.Q**2)
+        return _inner_horizon(self.M, self.a, self.Q)
     
     def ergosphere_radius(self, theta=np.pi/2):
         """Ergosphere radius at angle theta"""
-        return self.M + np.sqrt(self.M**2 - self.a**2 * np.cos(theta)**2 - self.Q**2)
+        return _ergosphere_radius(self.M, self.a, self.Q, theta)
     
     def is_physical(self):
         """Check if black hole parameters are physical (not naked singularity)"""
@@ -117,7 +209,6 @@ class KerrNewmanBlackHole:
         if r < self.r_minus:
             return np.nan
         
-        delta = r**2 - 2*self.M*r + self.a**2 + self.Q**2
         rho2 = r**2 + self.a**2 * np.cos(np.pi/2)**2  # At equator
         
         # Throat circumference / 2π
@@ -138,14 +229,241 @@ class KerrNewmanBlackHole:
             return np.inf
         
         # Simplified effective potential for radial perturbations
-        delta = r**2 - 2*self.M*r + self.a**2 + self.Q**2
+        return _effective_potential(self.M, self.Q, r, l)
+
+
+class KerrNewmanBatch:
+    """
+    Struct-of-arrays collection of Kerr-Newman black holes.
+    
+    Masses, spins, charges and quantum_corrected flags are broadcast
+    against each other, so a full (mass, spin, charge) grid is built from
+    e.g. ``masses[:, None, None]``, ``spins[None, :, None]`` and
+    ``charges[None, None, :]``. Every method evaluates all configurations
+    in one NumPy pass and returns arrays of the broadcast shape.
+    
+    Unphysical configurations (naked singularities) give NaN horizons
+    instead of raising, and can be filtered with is_physical().
+    """
+    
+    def __init__(self, mass_kg, spin=0.5, charge_e=1.0, quantum_corrected=True):
+        """
+        Parameters:
+        -----------
+        mass_kg : array_like
+            Masses in kilograms
+        spin : array_like
+            Spin quantum numbers
+        charge_e : array_like
+            Charges in units of elementary charge
+        quantum_corrected : bool or array_like of bool
+            Compton-scale (True) or classical (False) parameters; may be
+            mixed per configuration
+        """
+        (self.m_kg, self.spin, self.charge_e,
+         self.quantum_corrected) = np.broadcast_arrays(
+            np.asarray(mass_kg, dtype=float),
+            np.asarray(spin, dtype=float),
+            np.asarray(charge_e, dtype=float),
+            np.asarray(quantum_corrected, dtype=bool))
+        
+        if self.quantum_corrected.all():
+            M, a, Q = kerr_newman_parameters(self.m_kg, self.spin,
+                                              self.charge_e, True)
+        elif not self.quantum_corrected.any():
+            M, a, Q = kerr_newman_parameters(self.m_kg, self.spin,
+                                              self.charge_e, False)
+        else:
+            quantum = kerr_newman_parameters(self.m_kg, self.spin,
+                                              self.charge_e, True)
+            classical = kerr_newman_parameters(self.m_kg, self.spin,
+                                                self.charge_e, False)
+            M, a, Q = (np.where(self.quantum_corrected, q, c)
+                       for q, c in zip(quantum, classical))
+        self.M, self.a, self.Q = (np.broadcast_to(x, self.shape)
+                                  for x in (M, a, Q))
+    
+    # Key radii, computed on first access
+    @cached_property
+    def r_plus(self):
+        return self.outer_horizon()
+    
+    @cached_property
+    def r_minus(self):
+        return self.inner_horizon()
+    
+    @cached_property
+    def r_ergosphere(self):
+        return self.ergosphere_radius()
+    
+    @property
+    def shape(self):
+        return self.m_kg.shape
+    
+    @property
+    def size(self):
+        return self.m_kg.size
+    
+    def __len__(self):
+        return len(self.m_kg)
+    
+    def __getitem__(self, index):
+        """Index like an array: a single element gives a KerrNewmanBlackHole"""
+        parts = (self.m_kg[index], self.spin[index],
+                 self.charge_e[index], self.quantum_corrected[index])
+        if np.ndim(parts[0]) == 0:
+            return KerrNewmanBlackHole(float(parts[0]), spin=float(parts[1]),
+                                       charge_e=float(parts[2]),
+                                       quantum_corrected=bool(parts[3]))
+        return KerrNewmanBatch(*parts)
+    
+    def outer_horizon(self):
+        """Outer event horizon radii (NaN for naked singularities)"""
+        with np.errstate(invalid='ignore'):
+            return _outer_horizon(self.M, self.a, self.Q)
+    
+    def inner_horizon(self):
+        """Inner (Cauchy) horizon radii (NaN for naked singularities)"""
+        with np.errstate(invalid='ignore'):
+            return _inner_horizon(self.M, self.a, self.Q)
+    
+    def ergosphere_radius(self, theta=np.pi/2):
+        """Ergosphere radii at angle theta (broadcast against the batch)"""
+        with np.errstate(invalid='ignore'):
+            return _ergosphere_radius(self.M, self.a, self.Q, theta)
+    
+    def is_physical(self):
+        """Boolean mask of configurations with a horizon"""
+        return self.M**2 >= self.a**2 + self.Q**2
+    
+    def throat_geometry(self, r):
+        """
+        Equatorial throat radius at coordinate r, NaN inside r_minus.
+        
+        r is broadcast against the batch shape.
+        """
+        r = np.asarray(r, dtype=float)
+        rho2 = r**2 + self.a**2 * np.cos(np.pi/2)**2  # At equator
+        return np.where(r < self.r_minus, np.nan, np.sqrt(rho2))
+    
+    def effective_potential(self, r, l=0):
+        """
+        Effective potential for throat oscillations, +inf inside r_plus.
+        
+        Parameters:
+        -----------
+        r : array_like
+            Radial coordinates, broadcast against the batch shape. To
+            evaluate a radial grid for every configuration, build the
+            batch with a trailing length-1 axis and pass r as a row.
+        l : int or array_like
+            Angular momentum quantum number(s), also broadcast
+        """
+        r = np.asarray(r, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            V_eff = _effective_potential(self.M, self.Q, r, l)
+        return np.where(r <= self.r_plus, np.inf, V_eff)
+
+
+def solve_bracketed(func, lo, hi, rtol=4*np.finfo(float).eps, maxiter=200):
+    """
+    Vectorised Illinois (modified regula falsi) root finder.
+    
+    Every element of [lo, hi] must bracket a sign change of func, which is
+    called on whole arrays of abscissae (same shape as lo/hi) and must
+    return residuals of that shape.
+    
+    Returns:
+    --------
+    x : ndarray
+        Roots, refined until the bracket shrinks to rtol*max(|x|, 1), so
+        roots at or near zero still terminate
+    converged : ndarray of bool
+        Per-root convergence flag
+    """
+    a, b = np.broadcast_arrays(np.array(lo, dtype=float),
+                               np.array(hi, dtype=float))
+    a, b = a.copy(), b.copy()
+    fa, fb = func(a), func(b)
+    side = np.zeros(a.shape, dtype=int)
+    
+    x = np.where(fa == 0, a, b)
+    done = (fa == 0) | (fb == 0)
+    for _ in range(maxiter):
+        if done.all():
+            break
+        with np.errstate(invalid='ignore', divide='ignore'):
+            c = (a * fb - b * fa) / (fb - fa)
+        # Fall back to bisection if the secant step leaves the bracket
+        bad = ~np.isfinite(c) | (c <= np.minimum(a, b)) | (c >= np.maximum(a, b))
+        c = np.where(bad, 0.5 * (a + b), c)
+        fc = func(c)
         
-        # Centrifugal barrier + geometry
-        V_eff = (l * (l + 1) / r**2 + 
-                 (2*self.M - r) / r**3 + 
-                 self.Q**2 / r**4)
+        active = ~done
+        x = np.where(active, c, x)
+        hit = active & (fc == 0)
+        move_b = active & ~hit & (fc * fb > 0)
+        move_a = active & ~hit & ~move_b
         
-        return V_eff
+        fa = np.where(move_b & (side == -1), fa / 2, fa)
+        fb = np.where(move_a & (side == 1), fb / 2, fb)
+        b, fb = np.where(move_b, c, b), np.where(move_b, fc, fb)
+        a, fa = np.where(move_a, c, a), np.where(move_a, fc, fa)
+        side = np.where(move_b, -1, np.where(move_a, 1, side))
+        
+        done |= hit | (np.abs(b - a) <= rtol * np.maximum(np.abs(x), 1.0))
+    
+    return x, done
+
+
+def ragged_arange(start, stop):
+    """
+    Concatenation of arange(start[i], stop[i]) for all i, and the owner i.
+
+    Empty ranges (stop <= start) contribute nothing.
+    """
+    counts = np.maximum(stop - start, 0)
+    owner = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.cumsum(counts) - counts
+    return np.arange(counts.sum()) - offsets[owner] + start[owner], owner
+
+
+def log_mass_windows(mass_range, n_points=None, per_decade=None, window=4096,
+                     overlap=1):
+    """
+    Walk a log10-mass grid in slices of at most `window` nodes.
+
+    The grid is either np.linspace(log10(lo), log10(hi), n_points), node
+    for node, or spaced 1/per_decade decades from lo; with per_decade the
+    upper bound may be np.inf and the walk never ends by itself.
+    Consecutive slices share `overlap` nodes, so neighbouring-node tests
+    see every pair (overlap 1) or triple (overlap 2) exactly once.
+
+    Yields:
+    -------
+    log_m : ndarray
+        log10(mass / kg) of the nodes in the slice
+    """
+    start = np.log10(mass_range[0])
+    stop = np.log10(mass_range[1])
+    if per_decade is None:
+        step = (stop - start) / (n_points - 1)
+    else:
+        step = 1.0 / per_decade
+        n_points = (np.inf if np.isinf(stop)
+                    else int(np.floor((stop - start) / step * (1 + 1e-12))) + 1)
+    window = max(window, overlap + 1)
+
+    i = 0
+    while True:
+        j = min(i + window, n_points)
+        log_m = start + np.arange(i, j) * step
+        if j == n_points and per_decade is None:
+            log_m[-1] = stop
+        yield log_m
+        if j == n_points:
+            return
+        i = j - overlap
 
 
 class WormholeThroatResonance:
@@ -157,6 +475,8 @@ class WormholeThroatResonance:
     atomic orbitals but in the geometry itself.
     """
     
+    __slots__ = ('bh',)
+    
     def __init__(self, black_hole):
         self.bh = black_hole
         
@@ -184,9 +504,8 @@ class WormholeThroatResonance:
         2. Throat must support standing wave modes
         3. Energy must match throat oscillation quantum
         """
-        bh = KerrNewmanBlackHole(mass_kg, spin=self.bh.spin, charge_e=self.bh.charge_e)
-        
-        if not bh.is_physical():
+        if not is_physical_configuration(mass_kg, spin=self.bh.spin,
+                                         charge_e=self.bh.charge_e):
             return False, np.inf
         
         # Calculate throat resonance energy
@@ -201,28 +520,129 @@ class WormholeThroatResonance:
         
         return delta_E < 0.1, delta_E  # 10% tolerance for now
     
-    def find_resonant_masses(self, mass_range=(1e-33, 1e-25), n_modes=5):
+    def resonance_residual(self, mass_kg, n=1):
         """
-        Search for masses that produce stable throat resonances.
+        Signed resonance mismatch E_resonance - m c^2 (J).
+        
+        Vectorised over mass_kg and n; NaN where the black hole with this
+        spin and charge would be unphysical, so no root is reported there.
+        """
+        mass_kg = np.asarray(mass_kg, dtype=float)
+        physical = is_physical_configuration(mass_kg, spin=self.bh.spin,
+                                             charge_e=self.bh.charge_e)
+        E_resonance = HBAR * self.throat_oscillation_frequency(np.asarray(n))
+        return np.where(physical, E_resonance - mass_kg * C**2, np.nan)
+    
+    def find_resonant_masses(self, mass_range=(1e-33, 1e-25), n_modes=5,
+                             n_brackets=64):
+        """
+        Solve E_resonance(n) = m c^2 for every mode n = 1..n_modes.
+        
+        The residual is sampled on a coarse log-mass grid to bracket its
+        sign changes, then each bracket is refined to machine precision
+        with a vectorised Illinois solver, all modes at once.
         
         Returns:
         --------
-        resonant_masses : list
-            Masses (in kg) that satisfy stability conditions
+        resonant_masses : structured ndarray
+            One (mass, n, delta) record per mode with a converged root in
+            range, sorted by mass; delta is the relative mismatch at the
+            root. Brackets the solver fails to close are left out.
         """
-        masses = np.logspace(np.log10(mass_range[0]), 
-                           np.log10(mass_range[1]), 
-                           1000)
+        n = np.arange(1, n_modes + 1)
+        log_m = np.linspace(np.log10(mass_range[0]),
+                            np.log10(mass_range[1]),
+                            n_brackets)
+        residual = self.resonance_residual(10**log_m[None, :], n[:, None])
         
-        resonant_masses = []
+        # First sign change per mode (NaN comparisons are False)
+        change = residual[:, :-1] * residual[:, 1:] <= 0
+        has_root = change.any(axis=1)
+        first = change.argmax(axis=1)[has_root]
+        n = n[has_root]
         
-        for n in range(1, n_modes + 1):
-            for mass in masses:
-                stable, delta = self.stability_condition(mass, n=n)
-                if stable:
-                    resonant_masses.append((mass, n, delta))
+        log_root, converged = solve_bracketed(
+            lambda x: self.resonance_residual(10**x, n),
+            log_m[first], log_m[first + 1])
+        mass = 10**log_root[converged]
+        n = n[converged]
+        delta = np.abs(self.resonance_residual(mass, n)) / (mass * C**2)
         
-        return resonant_masses
+        resonant_masses = np.empty(len(n), dtype=RESONANCE_DTYPE)
+        resonant_masses['mass'] = mass
+        resonant_masses['n'] = n
+        resonant_masses['delta'] = delta
+        return np.sort(resonant_masses, order='mass')
+
+    def iter_resonances(self, mass_range=(1e-33, 1e-25), n_modes=5,
+                        n_brackets=64, per_decade=None, window=1024,
+                        mode_block=256, max_hits=None):
+        """
+        Stream resonances in order of increasing mass.
+
+        The bracketing grid of find_resonant_masses() is walked in slices
+        of `window` nodes and the modes in blocks of `mode_block`, so
+        memory stays bounded whatever the range or mode count. Every sign
+        change of the residual is refined and, if the solver converges,
+        yielded as soon as its slice is done; for this residual that is
+        one root per mode.
+
+        Parameters:
+        -----------
+        mass_range : (float, float)
+            Mass range in kg; the upper bound may be np.inf with per_decade
+        n_modes : int
+            Modes n = 1..n_modes
+        n_brackets : int
+            Bracketing nodes over the whole range (ignored with per_decade)
+        per_decade : float, optional
+            Bracketing nodes per decade instead of n_brackets
+        window, mode_block : int
+            Slice sizes along mass and mode
+        max_hits : int, optional
+            Stop after this many resonances
+
+        Yields:
+        -------
+        resonance : RESONANCE_DTYPE record (mass, n, delta)
+        """
+        hits = 0
+        first = True
+        for log_m in log_mass_windows(mass_range, n_brackets, per_decade,
+                                      window, overlap=1):
+            found = []
+            for n_start in range(1, n_modes + 1, mode_block):
+                n = np.arange(n_start, min(n_start + mode_block, n_modes + 1))
+                residual = self.resonance_residual(10**log_m[None, :],
+                                                   n[:, None])
+                # A root on a node belongs to the pair ending there, so
+                # shared slice edges do not report it twice
+                left, right = residual[:, :-1], residual[:, 1:]
+                change = (np.sign(left) * np.sign(right) < 0) | (right == 0)
+                change[:, 0] |= first & (left[:, 0] == 0)
+                rows, cols = np.nonzero(change)
+                if not len(rows):
+                    continue
+                n = n[rows]
+                log_root, converged = solve_bracketed(
+                    lambda x: self.resonance_residual(10**x, n),
+                    log_m[cols], log_m[cols + 1])
+                block = np.empty(converged.sum(), dtype=RESONANCE_DTYPE)
+                block['mass'] = 10**log_root[converged]
+                block['n'] = n[converged]
+                block['delta'] = (np.abs(self.resonance_residual(block['mass'],
+                                                                 block['n']))
+                                  / (block['mass'] * C**2))
+                found.append(block)
+            first = False
+            if not found:
+                continue
+            for resonance in np.sort(np.concatenate(found), order='mass',
+                                     kind='stable'):
+                yield resonance
+                hits += 1
+                if max_hits is not None and hits >= max_hits:
+                    return
 
 
 def calculate_mass_ratios(masses):
@@ -288,7 +708,15 @@ if __name__ == "__main__":
     print(f"  Outer horizon r+: {electron_bh.r_plus:.3e} m")
     print(f"  Compton wavelength: {compton_wavelength(M_ELECTRON):.3e} m")
     print(f"  Physical? {electron_bh.is_physical()}")
-    
+
+    # Whole (mass, spin, charge) grid in one broadcast pass
+    print("\nBatched sweep over mass x spin x charge...")
+    sweep = KerrNewmanBatch(np.logspace(-33, -25, 1000)[:, None, None],
+                            spin=np.array([0, 0.5, 1, 1.5, 2])[None, :, None],
+                            charge_e=np.array([-1, -2/3, -1/3, 0, 1/3, 2/3, 1]))
+    print(f"  Configurations: {sweep.size}")
+    print(f"  Physical fraction: {sweep.is_physical().mean():.3f}")
+
     # Search for resonances
     print("\nSearching for resonant throat configurations...")
     resonance = WormholeThroatResonance(electron_bh)
@@ -297,15 +725,23 @@ if __name__ == "__main__":
         n_modes=3
     )
     
-    if resonant_masses:
+    if len(resonant_masses):
         print(f"\nFound {len(resonant_masses)} resonant configurations:")
-        unique_masses = sorted(list(set([m for m, n, d in resonant_masses])))
         
-        for i, mass in enumerate(unique_masses[:10]):  # Show first 10
-            print(f"  Mode {i+1}: {mass:.3e} kg ({mass/M_ELECTRON:.1f} × electron mass)")
+        for mass, n, delta in resonant_masses[:10]:  # Show first 10
+            print(f"  Mode {n}: {mass:.3e} kg ({mass/M_ELECTRON:.1f} × electron mass)")
         
         # Compare to known particles
-        compare_to_known_particles(unique_masses[:5])
+        compare_to_known_particles(list(resonant_masses['mass'][:5]))
     else:
         print("\nNo resonances found in search range.")
         print("Model parameters may need refinement.")
+
+    # Lowest resonances of a 1e14 kg hole, streamed from an open-ended range
+    print("\nStreaming the two lightest resonances of a 1e14 kg hole...")
+    primordial = WormholeThroatResonance(KerrNewmanBlackHole(1e14, spin=0.1,
+                                                             charge_e=0.5))
+    for mass, n, delta in primordial.iter_resonances(
+            mass_range=(1e-40, np.inf), n_modes=10**4, per_decade=4,
+            max_hits=2):
+        print(f"  Mode {n}: {mass:.6e} kg")
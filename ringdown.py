@@ -0,0 +1,221 @@
+"""
+Time-Domain Throat Perturbations and Ringdown Frequencies
+=========================================================
+
+Independent check of the throat mode frequencies: instead of solving an
+eigenvalue problem (throat_modes.py), a Gaussian pulse is evolved through
+the tortoise-form effective potential with the 1+1D wave equation
+
+    psi_tt = psi_r*r* - V(r) psi,
+
+and the complex ringdown frequencies are read off the late-time signal
+at an observer with the matrix pencil method.
+
+Every (configuration, l) pair is one row of a 2D field array, so all of
+them advance together in a single vectorised leapfrog step. Waveforms are
+streamed into a .npy file in chunks, so evolution length is limited by
+disk rather than RAM. Times and lengths are in units of M (c = 1) until
+converted with to_physical().
+"""
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from kerr_newman_geometry import C, M_ELECTRON, KerrNewmanBatch
+from throat_modes import ThroatModeSolver
+
+
+class RingdownEvolver:
+    """
+    Vectorised leapfrog evolver for many (l, M, a, Q) rows at once.
+
+    Unphysical configurations (no horizon) are dropped; self.config and
+    self.l record the flat batch index and l of every evolved row.
+    """
+
+    def __init__(self, batch, l_values=(1, 2), rstar_range=(-150.0, 350.0),
+                 h=0.1, courant=0.5):
+        """
+        Parameters:
+        -----------
+        batch : KerrNewmanBatch
+            Background configurations
+        l_values : sequence of int
+            Angular momentum quantum numbers evolved for each configuration
+        rstar_range : (float, float)
+            Tortoise-coordinate domain in units of M
+        h : float
+            Grid spacing in units of M
+        courant : float
+            Time step as a fraction of h (must be <= 1)
+        """
+        n_points = int(round((rstar_range[1] - rstar_range[0]) / h)) - 1
+        grid = ThroatModeSolver(batch, n_points=n_points,
+                                rstar_range=rstar_range)
+        self.batch = batch
+        self.rstar = grid.rstar
+        self.h = grid.h
+        self.dt = courant * grid.h
+
+        l_values = np.atleast_1d(l_values)
+        physical = np.flatnonzero(grid.physical)
+        self.config = np.tile(physical, len(l_values))
+        self.l = np.repeat(l_values, len(physical))
+        self.M = np.tile(grid._flat.M, len(l_values))
+        self.V = np.concatenate([grid.potential(l) for l in l_values])
+
+    def _laplacian(self, psi):
+        lap = np.zeros_like(psi)
+        lap[:, 1:-1] = (psi[:, 2:] - 2 * psi[:, 1:-1] + psi[:, :-2]) / self.h**2
+        return lap
+
+    def evolve(self, t_final, observer=50.0, pulse_center=10.0,
+               pulse_width=3.0, record_every=4, out=None, chunk=1024):
+        """
+        Evolve a time-symmetric Gaussian pulse and record psi at the observer.
+
+        Parameters:
+        -----------
+        t_final : float
+            Evolution time in units of M
+        observer : float
+            Observer position r* in units of M
+        pulse_center, pulse_width : float
+            Initial Gaussian in r*, units of M
+        record_every : int
+            Record one sample every this many time steps
+        out : str or None
+            If given, waveforms are streamed to this .npy file (memory
+            mapped) chunk by chunk instead of being kept in RAM
+        chunk : int
+            Samples buffered in memory between writes
+
+        Returns:
+        --------
+        times : ndarray
+            Sample times in units of M
+        waveforms : ndarray or memmap
+            Shape (n_rows, n_samples)
+        """
+        n_steps = int(np.ceil(t_final / self.dt))
+        n_samples = n_steps // record_every + 1
+        shape = (len(self.V), n_samples)
+        if out is None:
+            waveforms = np.empty(shape)
+        else:
+            waveforms = open_memmap(out, mode='w+', dtype=float, shape=shape)
+        i_obs = np.searchsorted(self.rstar, observer)
+
+        psi = np.exp(-((self.rstar - pulse_center) / pulse_width)**2)
+        psi = np.repeat(psi[None, :], len(self.V), axis=0)
+        # Time-symmetric start: psi(-dt) = psi(dt)
+        psi_prev = psi + 0.5 * self.dt**2 * (self._laplacian(psi) - self.V * psi)
+
+        buffer = np.empty((len(self.V), chunk))
+        filled, written = 0, 0
+        ratio = self.dt / self.h
+        for step in range(n_steps + 1):
+            if step % record_every == 0:
+                buffer[:, filled] = psi[:, i_obs]
+                filled += 1
+                if filled == chunk:
+                    waveforms[:, written:written + filled] = buffer
+                    written += filled
+                    filled = 0
+            if step == n_steps:
+                break
+
+            psi_next = (2 * psi - psi_prev
+                        + self.dt**2 * (self._laplacian(psi) - self.V * psi))
+            # First-order outgoing conditions at both ends
+            psi_next[:, 0] = psi[:, 0] + ratio * (psi[:, 1] - psi[:, 0])
+            psi_next[:, -1] = psi[:, -1] - ratio * (psi[:, -1] - psi[:, -2])
+            psi_prev, psi = psi, psi_next
+
+        waveforms[:, written:written + filled] = buffer[:, :filled]
+        if out is not None:
+            waveforms.flush()
+        times = np.arange(n_samples) * record_every * self.dt
+        return times, waveforms
+
+    def to_physical(self, omega):
+        """Convert complex frequencies from units of 1/M to rad/s, per row"""
+        return omega * C / self.M.reshape((-1,) + (1,) * (np.ndim(omega) - 1))
+
+
+def matrix_pencil(signals, dt, n_modes, pencil=None):
+    """
+    Complex frequencies of damped sinusoids by the matrix pencil method.
+
+    Each row of signals is modelled as sum_k A_k exp(-i omega_k t); all
+    rows are processed together with stacked SVDs and eigensolves.
+
+    Parameters:
+    -----------
+    signals : ndarray
+        Shape (n_rows, n_samples), uniformly sampled
+    dt : float
+        Sample spacing
+    n_modes : int
+        Number of damped sinusoids to keep
+    pencil : int or None
+        Pencil parameter L, default n_samples // 3
+
+    Returns:
+    --------
+    omega : ndarray of complex
+        Shape (n_rows, n_modes); Re = oscillation frequency, Im = -damping
+        rate. Sorted slowest-decaying first.
+    """
+    signals = np.atleast_2d(np.asarray(signals))
+    n = signals.shape[1]
+    L = n // 3 if pencil is None else pencil
+
+    # Stacked Hankel matrices, shape (n_rows, n - L, L + 1)
+    idx = np.arange(n - L)[:, None] + np.arange(L + 1)[None, :]
+    Y = signals[:, idx]
+    _, _, Vh = np.linalg.svd(Y, full_matrices=False)
+    V = np.conj(np.swapaxes(Vh[:, :n_modes, :], 1, 2))
+    V1, V2 = V[:, :-1, :], V[:, 1:, :]
+
+    z = np.linalg.eigvals(np.linalg.pinv(V1) @ V2)
+    omega = 1j * np.log(z.astype(complex)) / dt
+    # Slowest decay first
+    order = np.argsort(-omega.imag, axis=1)
+    return np.take_along_axis(omega, order, axis=1)
+
+
+def ringdown_frequencies(times, waveforms, t_start, t_end, n_modes=2):
+    """
+    Matrix-pencil fit to the [t_start, t_end] window of every waveform.
+
+    Returns complex frequencies in the units of 1/times, shape
+    (n_rows, n_modes).
+    """
+    window = (times >= t_start) & (times <= t_end)
+    return matrix_pencil(np.asarray(waveforms[:, window]),
+                         times[1] - times[0], n_modes)
+
+
+if __name__ == "__main__":
+    print("Time-domain throat ringdown")
+    print("=" * 60)
+
+    batch = KerrNewmanBatch(M_ELECTRON, spin=np.array([0.0, 0.1]), charge_e=0.0)
+    evolver = RingdownEvolver(batch, l_values=(1, 2))
+    print(f"Rows evolved together: {len(evolver.V)}")
+    print(f"Grid points per row: {len(evolver.rstar)}, dt = {evolver.dt:.3f} M")
+
+    times, waveforms = evolver.evolve(t_final=250.0)
+    omega = ringdown_frequencies(times, waveforms, t_start=70.0, t_end=200.0,
+                                 n_modes=2)
+
+    print("\nRingdown frequencies (units of 1/M, leading pair):")
+    for row in range(len(evolver.V)):
+        bh = batch[np.unravel_index(evolver.config[row], batch.shape)]
+        w = omega[row, 0]
+        print(f"  spin={bh.spin}, l={evolver.l[row]}: "
+              f"omega M = {abs(w.real):.4f} {w.imag:+.4f}i")
+
+    phys = evolver.to_physical(omega)
+    print(f"\nLeading mode, first row: {abs(phys[0, 0].real):.3e} rad/s")
@@ -0,0 +1,174 @@
+"""
+Shadow and Lensing Images of Micro-Black-Hole Throats
+=====================================================
+
+Backward ray-tracer for the apparent shadow and lensed sky of a
+KerrNewmanBlackHole seen by a distant observer at inclination theta_o.
+
+Each pixel (alpha, beta) of the observer's image plane fixes the
+conserved quantities of a null ray through Bardeen's impact parameters,
+
+    L = -alpha sin(theta_o),    p_theta(observer) = beta    (E = 1),
+
+and the ray is integrated inward with geodesics.GeodesicBatch. Captured
+rays form the shadow; escaped rays are coloured by where they land on a
+checkerboard celestial sphere. The image is cut into square tiles, each
+integrated as one vectorised batch, and tiles are spread over a process
+pool before being assembled into an image saved as PNG and/or NPZ.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from kerr_newman_geometry import M_ELECTRON, KerrNewmanBlackHole
+from geodesics import CAPTURED, ESCAPED, GeodesicBatch
+
+
+def _render_tile(job):
+    black_hole, settings, r_obs, theta_o, alpha, beta = job
+    geodesics = GeodesicBatch(black_hole, **settings)
+    y0, consts = geodesics.initial_state(r_obs, theta_o, 1.0,
+                                         -alpha * np.sin(theta_o),
+                                         p_theta=beta, mu=0.0)
+    y, fate, _ = geodesics.integrate(y0, consts, lambda_max=4 * r_obs)
+    return y[:, 2], y[:, 3], fate
+
+
+class ShadowRenderer:
+    """
+    Tiled, multi-process backward ray-tracer for one black hole.
+
+    Image-plane coordinates and radii are in units of the geometric
+    mass M.
+    """
+
+    def __init__(self, black_hole, inclination=np.pi/2, r_obs=500.0,
+                 field_of_view=16.0, rtol=1e-6, atol=1e-8):
+        """
+        Parameters:
+        -----------
+        black_hole : KerrNewmanBlackHole
+            Background geometry (must be physical)
+        inclination : float
+            Observer polar angle theta_o (rad); pi/2 is edge-on
+        r_obs : float
+            Observer radius in units of M
+        field_of_view : float
+            Full width of the image plane in units of M
+        rtol, atol : float
+            Integrator tolerances
+        """
+        self.bh = black_hole
+        self.inclination = inclination
+        self.r_obs = r_obs
+        self.field_of_view = field_of_view
+        self.settings = dict(rtol=rtol, atol=atol, r_escape=1.5 * r_obs)
+
+    def image_plane(self, resolution):
+        """Pixel-centre impact parameters (alpha, beta), shape (n, n) each"""
+        half = 0.5 * self.field_of_view
+        edges = np.linspace(-half, half, resolution + 1)
+        centres = 0.5 * (edges[1:] + edges[:-1])
+        alpha, beta = np.meshgrid(centres, centres[::-1])
+        return alpha, beta
+
+    def render(self, resolution=256, tile=64, processes=None):
+        """
+        Trace every pixel and return the raw ray endpoints.
+
+        Parameters:
+        -----------
+        resolution : int
+            Image is resolution x resolution pixels
+        tile : int
+            Tile edge length in pixels; one vectorised batch per tile
+        processes : int or None
+            Worker processes, default os.cpu_count(); 1 runs in-process
+
+        Returns:
+        --------
+        theta, phi : ndarray
+            Final polar/azimuthal angle of each ray, shape (n, n)
+        fate : ndarray of int
+            CAPTURED (shadow), ESCAPED or RUNNING per pixel
+        """
+        alpha, beta = self.image_plane(resolution)
+        corners = [(i, j) for i in range(0, resolution, tile)
+                   for j in range(0, resolution, tile)]
+        jobs = [(self.bh, self.settings, self.r_obs, self.inclination,
+                 alpha[i:i + tile, j:j + tile].ravel(),
+                 beta[i:i + tile, j:j + tile].ravel())
+                for i, j in corners]
+
+        processes = processes or os.cpu_count()
+        if processes == 1:
+            results = map(_render_tile, jobs)
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                results = list(pool.map(_render_tile, jobs))
+
+        theta = np.empty((resolution, resolution))
+        phi = np.empty((resolution, resolution))
+        fate = np.empty((resolution, resolution), dtype=int)
+        for (i, j), (t, p, f) in zip(corners, results):
+            shape = alpha[i:i + tile, j:j + tile].shape
+            theta[i:i + tile, j:j + tile] = t.reshape(shape)
+            phi[i:i + tile, j:j + tile] = p.reshape(shape)
+            fate[i:i + tile, j:j + tile] = f.reshape(shape)
+        return theta, phi, fate
+
+    @staticmethod
+    def celestial_image(theta, phi, fate, n_checks=12):
+        """
+        Colour escaped rays by a checkerboard on the celestial sphere.
+
+        Returns a float image in [0, 1]: 0 for the shadow, 0.35/0.85 for
+        the two checker colours, 0.6 for rays that neither escaped nor
+        were captured.
+        """
+        cell = (np.floor(theta / np.pi * n_checks)
+                + np.floor(np.mod(phi, 2 * np.pi) / np.pi * n_checks))
+        image = np.where(cell % 2 == 0, 0.85, 0.35)
+        image = np.where(fate == ESCAPED, image, 0.6)
+        return np.where(fate == CAPTURED, 0.0, image)
+
+    def save(self, path, theta, phi, fate):
+        """
+        Save a rendered frame; '.npz' stores the raw ray endpoints, any
+        other extension is written as an image via matplotlib.
+        """
+        if path.endswith('.npz'):
+            alpha, beta = self.image_plane(fate.shape[0])
+            np.savez_compressed(path, theta=theta, phi=phi, fate=fate,
+                                alpha=alpha, beta=beta,
+                                inclination=self.inclination,
+                                r_obs=self.r_obs)
+        else:
+            plt.imsave(path, self.celestial_image(theta, phi, fate),
+                       cmap='inferno', vmin=0.0, vmax=1.0)
+
+
+if __name__ == "__main__":
+    import time
+
+    print("Kerr-Newman shadow renderer")
+    print("=" * 60)
+
+    bh = KerrNewmanBlackHole(M_ELECTRON, spin=0.15, charge_e=0.5)
+    renderer = ShadowRenderer(bh, inclination=np.radians(80))
+    print(f"a/M = {bh.a / bh.M:.3f}, Q/M = {bh.Q / bh.M:.3f}")
+
+    start = time.time()
+    theta, phi, fate = renderer.render(resolution=128, tile=32)
+    print(f"Rendered 128x128 in {time.time() - start:.1f} s")
+
+    pixel = renderer.field_of_view / fate.shape[0]
+    area = np.sum(fate == CAPTURED) * pixel**2
+    print(f"Shadow area: {area:.2f} M^2 "
+          f"(effective radius {np.sqrt(area / np.pi):.3f} M)")
+
+    renderer.save('shadow.png', theta, phi, fate)
+    print("Image saved to shadow.png")
@@ -0,0 +1,266 @@
+"""
+Precomputed Mode-Spectrum Lookup Tables
+=======================================
+
+Tabulates, for every mode n = 1..n_max,
+
+- log10 of the WormholeThroatResonance throat frequency, which depends
+  on the black hole's mass only, on the log10(mass) axis, and
+- the signed ExtremalGeometricResonance mismatch (E_mode - m c^2) / m c^2,
+  whose absolute value is the stability parameter S, on a regular
+  log10(mass) x spin x charge grid,
+
+and serves arbitrary queries by not-a-knot cubic spline interpolation
+(one tensor-product B-spline per mode, over the axes the quantity
+depends on). The signed mismatch is tabulated instead of S because S
+has a kink at every resonance.
+
+At build time the splines are checked against the exact models at the
+centre of every grid cell. Twice the largest centre error among a cell
+and its neighbours is stored as that cell's error estimate and returned
+with each query. This is a heuristic, not a rigorous bound: it assumes
+the error peaks near cell centres and varies smoothly between cells.
+Tables are saved as compressed .npz files holding only the axes, spline
+coefficients and float32 error maps.
+"""
+
+import numpy as np
+from scipy import ndimage
+from scipy.interpolate import NdBSpline, make_interp_spline
+
+from kerr_newman_geometry import (C, HBAR, M_ELECTRON, M_MUON, M_TAU,
+                                  KerrNewmanBatch, WormholeThroatResonance)
+from extremal_resonance import ExtremalGeometricResonance
+
+QUANTITIES = ('log_frequency', 'mismatch')
+
+# Table axes (log10 mass, spin, charge) each quantity depends on
+QUANTITY_AXES = {'log_frequency': (0,), 'mismatch': (0, 1, 2)}
+
+
+def _exact(quantity, n, log_mass, spin=None, charge=None):
+    """The tabulated quantities straight from the models (broadcast)"""
+    mass = 10.0**log_mass
+    if quantity == 'log_frequency':
+        resonance = WormholeThroatResonance(KerrNewmanBatch(mass))
+        return np.log10(resonance.throat_oscillation_frequency(n))
+    model = ExtremalGeometricResonance(spin=spin, charge_e=charge)
+    return model.resonance_residual(mass, n)
+
+
+def _spline_coefficients(axes, values):
+    """Tensor-product not-a-knot interpolation: knots and coefficients"""
+    knots = []
+    for axis, x in enumerate(axes):
+        spline = make_interp_spline(x, values, k=3, axis=axis)
+        values = np.moveaxis(spline.c, 0, axis)
+        knots.append(spline.t)
+    return tuple(knots), values
+
+
+class SpectrumTable:
+    """
+    Spline-interpolated resonance spectrum on (log10 mass, spin, charge, n).
+
+    Build with SpectrumTable.build(), persist with save()/load(), query
+    with frequency() and stability().
+    """
+
+    def __init__(self, axes, n_max, knots, coefficients, errors):
+        """
+        Parameters:
+        -----------
+        axes : tuple of ndarray
+            log10(mass / kg), spin and charge node coordinates
+        n_max : int
+            Highest tabulated mode
+        knots : dict
+            quantity -> tuple of knot vectors, one per axis in
+            QUANTITY_AXES[quantity]
+        coefficients, errors : dict
+            quantity -> arrays of shape (n_max, nodes...) and
+            (n_max, cells...) over the axes in QUANTITY_AXES[quantity],
+            e.g. (n_max, n_mass) and (n_max, n_mass - 1) for
+            'log_frequency'
+        """
+        self.axes = tuple(np.asarray(x, dtype=float) for x in axes)
+        self.n_max = int(n_max)
+        self.knots = knots
+        self.coefficients = coefficients
+        self.errors = errors
+
+    @classmethod
+    def build(cls, mass_range=(1e-32, 1e-25), spin_range=(0.0, 2.0),
+              charge_range=(-1.0, 1.0), n_max=30, shape=(256, 41, 21)):
+        """
+        Tabulate both quantities and estimate the interpolation error.
+
+        Parameters:
+        -----------
+        mass_range : (float, float)
+            Mass bounds in kg (log-spaced nodes)
+        spin_range, charge_range : (float, float)
+            Linear node ranges
+        n_max : int
+            Modes 1..n_max are tabulated
+        shape : (int, int, int)
+            Nodes along log-mass, spin and charge (at least 4 each)
+
+        Returns:
+        --------
+        table : SpectrumTable
+        """
+        axes = (np.linspace(*np.log10(mass_range), shape[0]),
+                np.linspace(*spin_range, shape[1]),
+                np.linspace(*charge_range, shape[2]))
+
+        knots, coefficients, errors = {}, {}, {}
+        for quantity in QUANTITIES:
+            used = [axes[i] for i in QUANTITY_AXES[quantity]]
+            nodes = np.meshgrid(*used, indexing='ij')
+            centres = np.meshgrid(*(0.5 * (x[1:] + x[:-1]) for x in used),
+                                  indexing='ij')
+            points = np.stack([c.ravel() for c in centres], axis=-1)
+            coefficients[quantity] = np.empty((n_max,) + nodes[0].shape)
+            errors[quantity] = np.empty((n_max,) + centres[0].shape,
+                                        dtype=np.float32)
+            for k in range(n_max):
+                n = k + 1
+                values = _exact(quantity, n, *nodes)
+                knots[quantity], coefficients[quantity][k] = \
+                    _spline_coefficients(used, values)
+                spline = NdBSpline(knots[quantity],
+                                   coefficients[quantity][k], 3)
+                exact = _exact(quantity, n, *centres)
+                centre_error = np.abs(spline(points).reshape(exact.shape)
+                                      - exact)
+                # Centre errors alone miss the worst point of a cell;
+                # pooling neighbours with a factor 2 is an estimate of
+                # it, not a guarantee
+                errors[quantity][k] = 2 * ndimage.maximum_filter(
+                    centre_error, size=3, mode='nearest')
+        return cls(axes, n_max, knots, coefficients, errors)
+
+    def save(self, path):
+        """Write the table as a compressed .npz file"""
+        arrays = {f'axis{i}': x for i, x in enumerate(self.axes)}
+        for quantity in QUANTITIES:
+            arrays[quantity + '_coefficients'] = self.coefficients[quantity]
+            arrays[quantity + '_errors'] = self.errors[quantity]
+            for i, t in enumerate(self.knots[quantity]):
+                arrays[f'{quantity}_knots{i}'] = t
+        np.savez_compressed(path, n_max=self.n_max, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """Read a table written by save()"""
+        with np.load(path) as data:
+            axes = tuple(data[f'axis{i}'] for i in range(3))
+            knots = {q: tuple(data[f'{q}_knots{i}']
+                              for i in range(len(QUANTITY_AXES[q])))
+                     for q in QUANTITIES}
+            coefficients = {q: data[q + '_coefficients'] for q in QUANTITIES}
+            errors = {q: data[q + '_errors'] for q in QUANTITIES}
+            return cls(axes, int(data['n_max']), knots, coefficients, errors)
+
+    def interpolate(self, quantity, mass_kg, spin, charge_e, n):
+        """
+        Interpolate one tabulated quantity at broadcast query points.
+
+        Parameters:
+        -----------
+        quantity : {'log_frequency', 'mismatch'}
+        mass_kg, spin, charge_e : array_like
+            Query coordinates
+        n : int or array_like of int
+            Mode numbers in 1..n_max
+
+        Returns:
+        --------
+        value, error : ndarray
+            Interpolated value and the error estimate of the enclosing
+            grid cell; NaN outside the table
+        """
+        log_mass, spin, charge_e, n = np.broadcast_arrays(
+            np.log10(np.asarray(mass_kg, dtype=float)),
+            np.asarray(spin, dtype=float), np.asarray(charge_e, dtype=float),
+            np.asarray(n))
+        points = np.stack([log_mass.ravel(), spin.ravel(), charge_e.ravel()],
+                          axis=-1)
+        n = n.ravel()
+        inside = (n >= 1) & (n <= self.n_max)
+        for axis, x in zip(points.T, self.axes):
+            inside &= (axis >= x[0]) & (axis <= x[-1])
+        used = QUANTITY_AXES[quantity]
+        points = points[:, list(used)]
+        cell = [np.clip(np.searchsorted(self.axes[i], axis) - 1, 0,
+                        len(self.axes[i]) - 2)
+                for i, axis in zip(used, points.T)]
+
+        value = np.full(len(n), np.nan)
+        error = np.full(len(n), np.nan)
+        for mode in np.unique(n[inside]):
+            k = int(mode) - 1
+            rows = inside & (n == mode)
+            spline = NdBSpline(self.knots[quantity],
+                               self.coefficients[quantity][k], 3)
+            value[rows] = spline(points[rows])
+            error[rows] = self.errors[quantity][k][tuple(c[rows]
+                                                         for c in cell)]
+        return value.reshape(log_mass.shape), error.reshape(log_mass.shape)
+
+    def frequency(self, mass_kg, spin, charge_e, n):
+        """Throat frequency (rad/s) and its absolute error estimate"""
+        log_omega, error = self.interpolate('log_frequency', mass_kg, spin,
+                                            charge_e, n)
+        omega = 10.0**log_omega
+        return omega, omega * np.log(10) * error
+
+    def stability(self, mass_kg, spin, charge_e, n):
+        """Stability parameter S and its absolute error estimate"""
+        mismatch, error = self.interpolate('mismatch', mass_kg, spin,
+                                           charge_e, n)
+        return np.abs(mismatch), error
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    print("Mode-spectrum lookup tables")
+    print("=" * 60)
+
+    start = time.time()
+    table = SpectrumTable.build(n_max=30)
+    print(f"\nBuilt {table.n_max} modes on "
+          f"{'x'.join(str(len(x)) for x in table.axes)} nodes "
+          f"in {time.time() - start:.1f} s")
+
+    path = os.path.join(tempfile.mkdtemp(), 'spectrum.npz')
+    table.save(path)
+    table = SpectrumTable.load(path)
+    print(f"Saved {os.path.getsize(path) / 1e6:.1f} MB to {path}")
+
+    rng = np.random.default_rng(1)
+    n_query = 200_000
+    mass = 10**rng.uniform(np.log10(M_ELECTRON), np.log10(M_TAU), n_query)
+    spin = rng.uniform(0.25, 2.0, n_query)
+    charge = rng.uniform(-1, 1, n_query)
+    n = rng.integers(1, 31, n_query)
+
+    start = time.time()
+    S, estimate = table.stability(mass, spin, charge, n)
+    elapsed = time.time() - start
+    exact = np.abs(_exact('mismatch', n, np.log10(mass), spin, charge))
+    print(f"\n{n_query} stability queries: {elapsed / n_query * 1e6:.2f} us "
+          f"per point")
+    print(f"  max |error| {np.max(np.abs(S - exact)):.2e}, "
+          f"estimate exceeded at {np.sum(np.abs(S - exact) > estimate)} points")
+
+    omega, estimate = table.frequency(mass, spin, charge, n)
+    exact = 10**_exact('log_frequency', n, np.log10(mass))
+    print(f"Frequency max relative error {np.max(np.abs(omega / exact - 1)):.2e}")
+
+    S, _ = table.stability([M_ELECTRON, M_MUON, M_TAU], 0.5, -1, 2)
+    print(f"\nS(n=2, spin 1/2, charge -1) for e, mu, tau: {np.round(S, 4)}")
@@ -0,0 +1,288 @@
+"""
+Chunked, Resumable Parameter Sweeps
+===================================
+
+A sweep is a named grid of 1-D axes, e.g. (mass, spin, charge, n), whose
+Cartesian product can be far larger than memory. SweepEngine preallocates
+the full result cube as a memory-mapped .npy file, cuts its flat index
+range into fixed-size chunks and evaluates them in a process pool. Each
+worker evaluates its chunk as one vectorised call and writes it straight
+into the memory map; the parent records finished chunks in a JSON
+manifest beside the cube. A killed run is resumed by running the same
+sweep again: chunks already listed in the manifest are skipped.
+
+Evaluators are small picklable objects with an `axes` tuple naming the
+grid axes they read and a __call__ taking those axes as keyword arrays.
+Adapters are provided for KerrNewmanBatch (the array form of
+KerrNewmanBlackHole), ExtremalGeometricResonance and GeometricDecayModel.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import hashlib
+import json
+import os
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from kerr_newman_geometry import M_ELECTRON, M_TAU, KerrNewmanBatch
+from extremal_resonance import ExtremalGeometricResonance
+from decay_rates import GeometricDecayModel
+
+
+class HorizonEvaluator:
+    """Kerr-Newman radii or the physicality mask on (mass, spin, charge)"""
+
+    axes = ('mass', 'spin', 'charge')
+
+    def __init__(self, quantity='r_plus', quantum_corrected=True):
+        """
+        Parameters:
+        -----------
+        quantity : {'r_plus', 'r_minus', 'r_ergosphere', 'is_physical'}
+            What to store per cell
+        quantum_corrected : bool
+            Parameter mode, as in KerrNewmanBlackHole
+        """
+        self.quantity = quantity
+        self.quantum_corrected = quantum_corrected
+        self.dtype = bool if quantity == 'is_physical' else float
+
+    def __call__(self, mass, spin, charge):
+        batch = KerrNewmanBatch(mass, spin=spin, charge_e=charge,
+                                quantum_corrected=self.quantum_corrected)
+        if self.quantity == 'is_physical':
+            return batch.is_physical()
+        return getattr(batch, self.quantity)
+
+
+class ResonanceEvaluator:
+    """ExtremalGeometricResonance stability parameter S on (mass, spin, charge, n)"""
+
+    axes = ('mass', 'spin', 'charge', 'n')
+    dtype = float
+
+    def __call__(self, mass, spin, charge, n):
+        # The model is pure arithmetic in spin and charge, so one
+        # instance holding whole arrays evaluates every cell at once
+        model = ExtremalGeometricResonance(spin=spin, charge_e=charge)
+        return model.stability_parameter(mass, n)
+
+
+class DecayRateEvaluator:
+    """GeometricDecayModel rates on (m_initial, m_final, n_initial, n_final)"""
+
+    axes = ('m_initial', 'm_final', 'n_initial', 'n_final')
+    dtype = float
+
+    def __init__(self, include_weak=True):
+        self.include_weak = include_weak
+
+    def __call__(self, m_initial, m_final, n_initial, n_final):
+        model = GeometricDecayModel()
+        if self.include_weak:
+            return model.weak_decay_rate(m_initial, m_final,
+                                         n_initial, n_final)
+        return model.geometric_transition_rate(m_initial, m_final,
+                                               n_initial, n_final)
+
+
+def _evaluate_chunk(job):
+    path, evaluator, axes, start, stop = job
+    shape = tuple(len(values) for values in axes.values())
+    index = np.unravel_index(np.arange(start, stop), shape)
+    coords = dict(zip(axes, index))
+    kwargs = {name: axes[name][coords[name]] for name in evaluator.axes}
+    with np.errstate(all='ignore'):
+        values = evaluator(**kwargs)
+
+    cube = np.load(path, mmap_mode='r+')
+    cube.reshape(-1)[start:stop] = np.broadcast_to(values, stop - start)
+    cube.flush()
+    del cube
+    return start
+
+
+class SweepEngine:
+    """
+    Evaluate an evaluator on a named grid into a memory-mapped cube.
+
+    The cube has one dimension per axis, in the order given, so
+    cube[i, j, ...] holds the value at (axes[0][i], axes[1][j], ...).
+    Axes not read by the evaluator simply repeat its values.
+    """
+
+    def __init__(self, evaluator, axes, path, chunk_size=1_000_000):
+        """
+        Parameters:
+        -----------
+        evaluator : object
+            Picklable callable with `axes` and `dtype` attributes
+        axes : dict
+            Ordered axis name -> 1-D array of values
+        path : str
+            Result .npy file; the manifest is written next to it
+        chunk_size : int
+            Cells per chunk; bounds each worker's temporary memory
+        """
+        missing = set(evaluator.axes) - set(axes)
+        if missing:
+            raise ValueError(f"Grid lacks axes {sorted(missing)} "
+                             f"needed by {type(evaluator).__name__}")
+        self.evaluator = evaluator
+        self.axes = {name: np.asarray(values) for name, values in axes.items()}
+        self.path = path
+        self.manifest_path = os.path.splitext(path)[0] + '.manifest.json'
+        self.chunk_size = int(chunk_size)
+
+    @property
+    def shape(self):
+        return tuple(len(values) for values in self.axes.values())
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    @property
+    def n_chunks(self):
+        return -(-self.size // self.chunk_size)
+
+    def _fingerprint(self):
+        """Hash identifying the sweep, so a resume cannot mix two grids"""
+        digest = hashlib.sha256()
+        digest.update(repr((type(self.evaluator).__name__,
+                            sorted(vars(self.evaluator).items()),
+                            self.chunk_size)).encode())
+        for name, values in self.axes.items():
+            digest.update(name.encode())
+            digest.update(np.ascontiguousarray(values).tobytes())
+        return digest.hexdigest()
+
+    def _read_manifest(self):
+        if not (os.path.exists(self.manifest_path)
+                and os.path.exists(self.path)):
+            return None
+        with open(self.manifest_path) as f:
+            manifest = json.load(f)
+        if manifest['fingerprint'] != self._fingerprint():
+            raise ValueError(f"{self.manifest_path} belongs to a different "
+                             "sweep; remove it or choose another path")
+        return manifest
+
+    def _write_manifest(self, manifest):
+        # Write-then-rename, so a kill never leaves a truncated manifest
+        tmp = self.manifest_path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(manifest, f)
+        os.replace(tmp, self.manifest_path)
+
+    def completed(self):
+        """Indices of finished chunks (empty before the first run)"""
+        manifest = self._read_manifest()
+        return set() if manifest is None else set(manifest['completed'])
+
+    def run(self, processes=None, max_chunks=None):
+        """
+        Evaluate all outstanding chunks.
+
+        Parameters:
+        -----------
+        processes : int or None
+            Worker processes, default os.cpu_count(); 1 runs in-process
+        max_chunks : int or None
+            Stop after this many chunks (the rest stay pending)
+
+        Returns:
+        --------
+        cube : memmap
+            Read-only view of the result cube; cells of pending chunks
+            are unspecified
+        """
+        manifest = self._read_manifest()
+        if manifest is None:
+            open_memmap(self.path, mode='w+', dtype=self.evaluator.dtype,
+                        shape=self.shape).flush()
+            manifest = {'fingerprint': self._fingerprint(),
+                        'shape': self.shape,
+                        'axes': list(self.axes),
+                        'chunk_size': self.chunk_size,
+                        'n_chunks': self.n_chunks,
+                        'completed': []}
+            self._write_manifest(manifest)
+
+        done = set(manifest['completed'])
+        pending = [k for k in range(self.n_chunks) if k not in done]
+        if max_chunks is not None:
+            pending = pending[:max_chunks]
+        jobs = [(self.path, self.evaluator, self.axes, k * self.chunk_size,
+                 min((k + 1) * self.chunk_size, self.size))
+                for k in pending]
+
+        def record(start):
+            manifest['completed'].append(start // self.chunk_size)
+            self._write_manifest(manifest)
+
+        processes = processes or os.cpu_count()
+        if processes == 1:
+            for job in jobs:
+                record(_evaluate_chunk(job))
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                futures = [pool.submit(_evaluate_chunk, job) for job in jobs]
+                for future in as_completed(futures):
+                    record(future.result())
+        return np.load(self.path, mmap_mode='r')
+
+    def is_complete(self):
+        return len(self.completed()) == self.n_chunks
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    print("Chunked, resumable parameter sweeps")
+    print("=" * 60)
+
+    out_dir = tempfile.mkdtemp(prefix='sweep_')
+    axes = {'mass': np.geomspace(M_ELECTRON / 10, M_TAU * 10, 2000),
+            'spin': np.linspace(0, 2, 50),
+            'charge': np.linspace(-1, 1, 21),
+            'n': np.arange(1, 31)}
+    engine = SweepEngine(ResonanceEvaluator(), axes,
+                         os.path.join(out_dir, 'stability.npy'),
+                         chunk_size=2_000_000)
+    print(f"\nGrid {engine.shape}: {engine.size:.2e} cells "
+          f"in {engine.n_chunks} chunks")
+
+    # Simulate an interrupted run, then resume it
+    start = time.time()
+    engine.run(max_chunks=10)
+    print(f"First session: {len(engine.completed())} chunks "
+          f"in {time.time() - start:.1f} s")
+    start = time.time()
+    cube = engine.run()
+    print(f"Resumed: {len(engine.completed())}/{engine.n_chunks} chunks "
+          f"in {time.time() - start:.1f} s")
+
+    best = np.unravel_index(np.argmin(cube), cube.shape)
+    print(f"Smallest S = {cube[best]:.2e} at "
+          + ", ".join(f"{name}={axes[name][i]:.4g}"
+                      for name, i in zip(axes, best)))
+
+    # The same engine drives the geometry and decay models
+    horizons = SweepEngine(HorizonEvaluator('is_physical'),
+                           {k: axes[k] for k in ('mass', 'spin', 'charge')},
+                           os.path.join(out_dir, 'physical.npy'))
+    print(f"\nPhysical fraction: {horizons.run().mean():.3f}")
+
+    n = np.arange(1, 200)
+    decays = SweepEngine(DecayRateEvaluator(),
+                         {'m_initial': np.array([M_TAU]),
+                          'm_final': np.array([M_ELECTRON]),
+                          'n_initial': n, 'n_final': n},
+                         os.path.join(out_dir, 'decay.npy'))
+    rates = decays.run(processes=1)
+    print(f"Weak rates on a {rates.shape} cube, "
+          f"max {rates.max():.3e} 1/s")
+    print(f"Results in {out_dir}")
@@ -0,0 +1,209 @@
+"""
+Throat Embedding Surfaces and Mesh Export
+=========================================
+
+The t = const, theta = pi/2 slice of a Kerr-Newman geometry,
+
+    dl^2 = (r^2 / Delta) dr^2 + R(r)^2 dphi^2,
+    R^2 = r^2 + a^2 + (2Mr - Q^2) a^2 / r^2,
+
+is embedded in flat space as a surface of revolution (R(r), z(r)) with
+
+    dz/dr = sqrt(r^2/Delta - (dR/dr)^2).
+
+With r = r_plus + u^2 the integrand becomes finite at the horizon, so z is
+obtained by cumulative trapezoidal quadrature on a u grid for a whole
+KerrNewmanBatch at once. Mirroring z -> -z gives the second sheet of the
+Einstein-Rosen throat; for Schwarzschild this is Flamm's paraboloid.
+
+Surfaces are triangulated and written as binary PLY or ASCII OBJ, and a
+particle catalog can be exported in parallel with export_catalog().
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import numpy as np
+from scipy.integrate import cumulative_trapezoid
+
+from kerr_newman_geometry import (M_ELECTRON, M_MUON, M_TAU, M_PROTON,
+                                  KerrNewmanBatch)
+
+
+def embedding_profiles(batch, n_r=256, r_max=12.0):
+    """
+    Embedding profiles (R, z) for every configuration, in units of M.
+
+    Parameters:
+    -----------
+    batch : KerrNewmanBatch
+        Configurations (flattened); unphysical ones give NaN rows
+    n_r : int
+        Radial samples from the horizon out to r_max
+    r_max : float
+        Outer radius in units of M
+
+    Returns:
+    --------
+    R, z : ndarray
+        Shape (batch.size, n_r). z is NaN beyond the first radius where
+        the slice stops being embeddable in flat space.
+    """
+    M = batch.M.reshape(-1, 1)
+    a = batch.a.reshape(-1, 1) / M
+    Q2 = (batch.Q.reshape(-1, 1) / M)**2
+    with np.errstate(invalid='ignore'):
+        r_plus = batch.r_plus.reshape(-1, 1) / M
+        r_minus = batch.r_minus.reshape(-1, 1) / M
+
+        u = np.linspace(0.0, 1.0, n_r)[None, :] * np.sqrt(r_max - r_plus)
+        r = r_plus + u**2
+        R = np.sqrt(r**2 + a**2 + (2 * r - Q2) * a**2 / r**2)
+        dR_dr = (r - a**2 / r**2 + Q2 * a**2 / r**3) / R
+
+        # dz/du = 2u dz/dr, with the 1/Delta pole cancelled analytically
+        radicand = r**2 / (r - r_minus) - u**2 * dR_dr**2
+        dz_du = 2 * np.sqrt(radicand)
+        z = cumulative_trapezoid(dz_du, u, axis=1, initial=0.0)
+
+    embeddable = np.cumprod(radicand >= 0, axis=1).astype(bool)
+    return R, np.where(embeddable, z, np.nan)
+
+
+def surface_mesh(R, z, n_phi=64, both_sheets=True):
+    """
+    Triangulate a surface of revolution.
+
+    Parameters:
+    -----------
+    R, z : 1-D ndarray
+        Profile (NaN samples are dropped from the outer end)
+    n_phi : int
+        Azimuthal segments
+    both_sheets : bool
+        Mirror through the throat to include the second sheet
+
+    Returns:
+    --------
+    vertices : ndarray, shape (n_v, 3)
+    faces : ndarray of int, shape (n_f, 3)
+    """
+    keep = np.isfinite(R) & np.isfinite(z)
+    R, z = R[keep], z[keep]
+    if both_sheets:
+        R = np.concatenate([R[:0:-1], R])
+        z = np.concatenate([-z[:0:-1], z])
+
+    phi = np.linspace(0, 2 * np.pi, n_phi, endpoint=False)
+    vertices = np.stack([R[:, None] * np.cos(phi), R[:, None] * np.sin(phi),
+                         np.broadcast_to(z[:, None], (len(z), n_phi))],
+                        axis=-1).reshape(-1, 3)
+
+    ring = np.arange(len(z) - 1)[:, None] * n_phi
+    j = np.arange(n_phi)[None, :]
+    v00, v01 = ring + j, ring + (j + 1) % n_phi
+    v10, v11 = v00 + n_phi, v01 + n_phi
+    faces = np.concatenate([np.stack([v00, v10, v11], axis=-1).reshape(-1, 3),
+                            np.stack([v00, v11, v01], axis=-1).reshape(-1, 3)])
+    return vertices, faces
+
+
+def write_ply(path, vertices, faces):
+    """Binary little-endian PLY"""
+    header = (f"ply\nformat binary_little_endian 1.0\n"
+              f"element vertex {len(vertices)}\n"
+              f"property float x\nproperty float y\nproperty float z\n"
+              f"element face {len(faces)}\n"
+              f"property list uchar int vertex_indices\nend_header\n")
+    face_records = np.empty(len(faces), dtype=[('n', '<u1'), ('v', '<i4', 3)])
+    face_records['n'] = 3
+    face_records['v'] = faces
+    with open(path, 'wb') as f:
+        f.write(header.encode('ascii'))
+        f.write(vertices.astype('<f4').tobytes())
+        f.write(face_records.tobytes())
+
+
+def write_obj(path, vertices, faces):
+    """ASCII Wavefront OBJ (1-based face indices)"""
+    with open(path, 'w') as f:
+        np.savetxt(f, vertices, fmt='v %.7g %.7g %.7g')
+        np.savetxt(f, faces + 1, fmt='f %d %d %d')
+
+
+def _export_one(job):
+    path, R, z, n_phi, both_sheets = job
+    vertices, faces = surface_mesh(R, z, n_phi, both_sheets)
+    writer = write_obj if path.endswith('.obj') else write_ply
+    writer(path, vertices, faces)
+    return path
+
+
+def export_catalog(catalog, out_dir, fmt='ply', n_r=256, r_max=12.0,
+                   n_phi=64, both_sheets=True, processes=None):
+    """
+    Write one throat mesh per particle, in parallel.
+
+    Profiles for the whole catalog are computed in one vectorised pass;
+    triangulation and file writing are spread over a process pool.
+
+    Parameters:
+    -----------
+    catalog : dict
+        name -> {'mass_kg', 'spin', 'charge'} (the layout used by the
+        particle tables in the analysis scripts)
+    out_dir : str
+        Output directory
+    fmt : {'ply', 'obj'}
+        Mesh format
+    processes : int or None
+        Worker count, default os.cpu_count(); 1 runs in-process
+
+    Returns:
+    --------
+    paths : dict
+        name -> written path; unphysical configurations are skipped
+    """
+    names = list(catalog)
+    batch = KerrNewmanBatch([catalog[n]['mass_kg'] for n in names],
+                            spin=[catalog[n]['spin'] for n in names],
+                            charge_e=[catalog[n]['charge'] for n in names])
+    R, z = embedding_profiles(batch, n_r=n_r, r_max=r_max)
+    physical = batch.is_physical()
+
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(os.path.join(out_dir, f"{name}.{fmt}"), R[i], z[i], n_phi,
+             both_sheets)
+            for i, name in enumerate(names) if physical[i]]
+
+    processes = processes or os.cpu_count()
+    if processes == 1:
+        written = list(map(_export_one, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            written = list(pool.map(_export_one, jobs))
+    return dict(zip([n for i, n in enumerate(names) if physical[i]], written))
+
+
+if __name__ == "__main__":
+    print("Throat embedding surfaces")
+    print("=" * 60)
+
+    # Flamm's paraboloid check: z = sqrt(8 M (r - 2M))
+    batch = KerrNewmanBatch(M_ELECTRON, spin=0.0, charge_e=0.0)
+    R, z = embedding_profiles(batch, n_r=2000)
+    flamm = np.sqrt(8 * (R[0] - 2))
+    print(f"\nSchwarzschild vs Flamm: max |dz| = {np.nanmax(abs(z[0] - flamm)):.2e} M")
+
+    # Spin/charge variants of the leptons and proton
+    catalog = {
+        'electron_s0.1_q0.5': {'mass_kg': M_ELECTRON, 'spin': 0.1, 'charge': 0.5},
+        'muon_s0.1_q0.5': {'mass_kg': M_MUON, 'spin': 0.1, 'charge': 0.5},
+        'tau_s0.1_q0.5': {'mass_kg': M_TAU, 'spin': 0.1, 'charge': 0.5},
+        'proton_s0_q1': {'mass_kg': M_PROTON, 'spin': 0.0, 'charge': 1.0},
+        'electron_s0.5_q1': {'mass_kg': M_ELECTRON, 'spin': 0.5, 'charge': 1.0},
+    }
+    paths = export_catalog(catalog, 'throat_meshes', fmt='ply')
+    print(f"\nWrote {len(paths)} meshes (unphysical entries skipped):")
+    for name, path in paths.items():
+        print(f"  {name}: {path}")
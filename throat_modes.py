@@ -0,0 +1,263 @@
+"""
+Computed Throat Mode Spectra
+============================
+
+WormholeThroatResonance assumes the throat spectrum
+omega_n = omega_0 * sqrt(n(n+1)). This module computes it instead, from
+the KerrNewmanBlackHole.effective_potential barrier.
+
+The radial perturbation equation in tortoise coordinates,
+
+    -d^2 psi / dr*^2 + V(r) psi = omega^2 psi / c^2,
+
+is discretised with second-order finite differences on a uniform r* grid
+inside a Dirichlet box. The resulting operator is a sparse tridiagonal
+matrix whose lowest eigenvalues are extracted with a shift-invert
+Lanczos solver. The tortoise grids and potentials of a whole batch of
+black-hole configurations are built with array operations; the
+eigenvalue solve itself is one sparse (or LAPACK tridiagonal) call per
+configuration and l, since neither solver batches over matrices.
+
+V is the effective potential dressed with the redshift factor
+Delta / (r^2 + a^2), so that it vanishes at the outer horizon and the
+horizon sits at r* -> -infinity.
+"""
+
+import numpy as np
+from scipy import sparse
+from scipy.integrate import cumulative_trapezoid
+from scipy.linalg import eigh_tridiagonal
+from scipy.sparse.linalg import eigsh
+
+from kerr_newman_geometry import C, M_ELECTRON, KerrNewmanBatch
+
+
+def tortoise_potential(batch, r, l=0):
+    """
+    Effective potential in tortoise form, Delta/(r^2+a^2) * V_eff(r, l).
+
+    Parameters:
+    -----------
+    batch : KerrNewmanBatch
+        Background configurations
+    r : array_like
+        Radial coordinates (m), broadcast against the batch shape
+    l : int or array_like
+        Angular momentum quantum number(s)
+
+    Returns:
+    --------
+    V : ndarray
+        Potential in m^-2, zero on and inside the outer horizon
+    """
+    r = np.asarray(r, dtype=float)
+    delta = (r - batch.r_plus) * (r - batch.r_minus)
+    V_eff = batch.effective_potential(r, l)
+    with np.errstate(invalid='ignore'):
+        V = delta / (r**2 + batch.a**2) * V_eff
+    return np.where(r <= batch.r_plus, 0.0, V)
+
+
+def tortoise_map(batch, rstar, n_u=8192, u_min=-30.0):
+    """
+    Invert the tortoise coordinate, r(r*), for every configuration.
+
+    dr*/dr = (r^2 + a^2) / Delta is integrated in u = ln((r - r_plus)/M),
+    where the integrand (r^2 + a^2)/(r - r_minus) stays finite at the
+    horizon. r* is measured in units of M and anchored to zero at
+    r = r_plus + M.
+
+    Parameters:
+    -----------
+    batch : KerrNewmanBatch
+        Physical background configurations (1-D batch)
+    rstar : ndarray
+        Tortoise coordinates in units of M, shape (n,) or (batch.size, n)
+    n_u : int
+        Quadrature points in u
+    u_min : float
+        Closest approach to the horizon, ln((r - r_plus)/M)
+
+    Returns:
+    --------
+    r : ndarray
+        Radii in units of M, shape (batch.size, n); NaN outside the range
+        covered by the quadrature
+
+    All rows share the u grid, so r* is located in every table at once
+    by a vectorised bisection over the u index.
+    """
+    M = batch.M.reshape(-1, 1)
+    r_plus = batch.r_plus.reshape(-1, 1) / M
+    r_minus = batch.r_minus.reshape(-1, 1) / M
+    a = batch.a.reshape(-1, 1) / M
+    rstar = np.broadcast_to(rstar, (M.shape[0], np.shape(rstar)[-1]))
+
+    u_max = np.log(2 * max(np.max(np.abs(rstar)), 1.0) + 100.0)
+    u = np.linspace(u_min, u_max, n_u)
+    r = r_plus + np.exp(u)
+    rstar_of_u = cumulative_trapezoid((r**2 + a**2) / (r - r_minus), u,
+                                      axis=1, initial=0.0)
+
+    # Anchor r* = 0 at u = 0, i.e. r = r_plus + M
+    j = np.searchsorted(u, 0.0)
+    w = -u[j - 1] / (u[j] - u[j - 1])
+    rstar_of_u -= (1 - w) * rstar_of_u[:, j - 1:j] + w * rstar_of_u[:, j:j + 1]
+
+    # r*(u) increases along every row; find lo with table[lo] <= r* < table[hi]
+    lo = np.zeros(rstar.shape, dtype=int)
+    hi = np.full(rstar.shape, n_u - 1)
+    while np.any(hi - lo > 1):
+        mid = (lo + hi) // 2
+        below = np.take_along_axis(rstar_of_u, mid, axis=1) <= rstar
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+    t_lo = np.take_along_axis(rstar_of_u, lo, axis=1)
+    t_hi = np.take_along_axis(rstar_of_u, hi, axis=1)
+    # Flat stretches of the table (rounding near the horizon) take t_lo
+    w = np.divide(rstar - t_lo, t_hi - t_lo, out=np.zeros(rstar.shape),
+                  where=t_hi > t_lo)
+    radius = (1 - w) * np.take_along_axis(r, lo, axis=1) \
+        + w * np.take_along_axis(r, hi, axis=1)
+    outside = (rstar < rstar_of_u[:, :1]) | (rstar > rstar_of_u[:, -1:])
+    return np.where(outside, np.nan, radius)
+
+
+class ThroatModeSolver:
+    """
+    Sparse finite-difference eigenvalue solver for throat modes.
+
+    One tortoise grid is built per configuration of a KerrNewmanBatch;
+    unphysical configurations (no horizon) are skipped and reported as
+    NaN frequencies.
+    """
+
+    def __init__(self, batch, n_points=2000, rstar_range=(-50.0, 250.0)):
+        """
+        Parameters:
+        -----------
+        batch : KerrNewmanBatch or KerrNewmanBlackHole
+            Background configurations; a scalar hole is treated as a
+            batch of one
+        n_points : int
+            Interior grid points per configuration
+        rstar_range : (float, float)
+            Dirichlet box in tortoise coordinate, in units of M
+        """
+        if not isinstance(batch, KerrNewmanBatch):
+            batch = KerrNewmanBatch(batch.m_kg, spin=batch.spin,
+                                    charge_e=batch.charge_e,
+                                    quantum_corrected=batch.quantum_corrected)
+        self.batch = batch
+        self.n_points = n_points
+        self.rstar_range = rstar_range
+
+        self.physical = batch.is_physical().ravel()
+        self._flat = KerrNewmanBatch(batch.m_kg.ravel()[self.physical],
+                                     spin=batch.spin.ravel()[self.physical],
+                                     charge_e=batch.charge_e.ravel()[self.physical],
+                                     quantum_corrected=batch.quantum_corrected.ravel()[self.physical])
+
+        # Box edges; the inner edge must stay where the r(r*) table is valid
+        rstar = np.linspace(rstar_range[0], rstar_range[1], n_points + 2)
+        self.rstar = rstar[1:-1]
+        self.h = rstar[1] - rstar[0]
+        self.r = tortoise_map(self._flat, self.rstar)  # units of M
+
+    def potential(self, l=0):
+        """
+        Dimensionless potential M^2 V on the grid, shape (n_physical, n_points).
+
+        Grid points closer to the horizon than the tortoise table reaches
+        carry the horizon value V = 0.
+        """
+        M = self._flat.M.reshape(-1, 1)
+        r_si = np.nan_to_num(self.r, nan=0.0) * M
+        column = KerrNewmanBatch(self._flat.m_kg[:, None],
+                                 spin=self._flat.spin[:, None],
+                                 charge_e=self._flat.charge_e[:, None],
+                                 quantum_corrected=self._flat.quantum_corrected[:, None])
+        return tortoise_potential(column, r_si, l) * M**2
+
+    def operator(self, V):
+        """Sparse tridiagonal matrix -d^2/dr*^2 + V for one potential row"""
+        off = np.full(len(V) - 1, -1.0 / self.h**2)
+        return sparse.diags([off, 2.0 / self.h**2 + V, off], [-1, 0, 1],
+                            format='csc')
+
+    def _lowest(self, V, k, method):
+        if method == 'banded':
+            off = np.full(len(V) - 1, -1.0 / self.h**2)
+            return eigh_tridiagonal(2.0 / self.h**2 + V, off, eigvals_only=True,
+                                    select='i', select_range=(0, k - 1))
+        # Shift below the spectrum so shift-invert returns the lowest k
+        sigma = V.min() - 1.0 / (self.rstar[-1] - self.rstar[0])**2
+        values = eigsh(self.operator(V), k=k, sigma=sigma, which='LM',
+                       return_eigenvectors=False)
+        return np.sort(values)
+
+    def eigenvalues(self, l_values=(0, 1, 2), k=5, method='shift-invert'):
+        """
+        Lowest k eigenvalues M^2 omega^2 / c^2 per configuration and l.
+
+        Parameters:
+        -----------
+        l_values : sequence of int
+            Angular momentum quantum numbers
+        k : int
+            Number of eigenvalues per (configuration, l)
+        method : {'shift-invert', 'banded'}
+            Sparse shift-invert Lanczos, or LAPACK's tridiagonal bisection
+            solver (faster for small k on tridiagonal operators)
+
+        Returns:
+        --------
+        lam : ndarray
+            Shape batch.shape + (len(l_values), k), NaN where unphysical
+
+        The potentials for each l are computed for the whole batch at
+        once, but the eigensolver runs once per physical configuration
+        and l, so the cost grows linearly with batch.size.
+        """
+        l_values = np.atleast_1d(l_values)
+        lam = np.full((self.batch.size, len(l_values), k), np.nan)
+        rows = np.flatnonzero(self.physical)
+        for j, l in enumerate(l_values):
+            V = self.potential(l)
+            for i, row in enumerate(rows):
+                lam[row, j] = self._lowest(V[i], k, method)
+        return lam.reshape(self.batch.shape + (len(l_values), k))
+
+    def spectrum(self, l_values=(0, 1, 2), k=5, method='shift-invert'):
+        """
+        Mode angular frequencies omega (rad/s), same shape as eigenvalues().
+
+        Negative eigenvalues (bound, growing modes) come out as NaN.
+        """
+        lam = self.eigenvalues(l_values, k, method)
+        M = self.batch.M[..., None, None]
+        with np.errstate(invalid='ignore'):
+            return C * np.sqrt(lam) / M
+
+
+if __name__ == "__main__":
+    print("Computed throat mode spectra")
+    print("=" * 60)
+
+    masses = np.array([1, 10, 100]) * M_ELECTRON
+    batch = KerrNewmanBatch(masses[:, None], spin=np.array([0.0, 0.1]),
+                            charge_e=0.0)
+    solver = ThroatModeSolver(batch, n_points=1500)
+    omega = solver.spectrum(l_values=(0, 1, 2), k=4)
+
+    for index in np.ndindex(batch.shape):
+        bh = batch[index]
+        print(f"\nm = {bh.m_kg:.3e} kg, spin = {bh.spin}")
+        for j, l in enumerate((0, 1, 2)):
+            row = ", ".join(f"{w:.3e}" for w in omega[index][j])
+            print(f"  l={l}: omega = [{row}] rad/s")
+
+        # Compare with the sqrt(n(n+1)) ansatz normalised to the lowest mode
+        ratios = omega[index][1] / omega[index][1][0]
+        print(f"  l=1 ratios: {np.round(ratios, 3)} "
+              f"(ansatz: {np.round(np.sqrt([2, 6, 12, 20]) / np.sqrt(2), 3)})")